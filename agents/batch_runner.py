@@ -0,0 +1,171 @@
+# furiachat/agents/batch_runner.py
+"""Runner em lote: responde um arquivo de perguntas e grava JSONL.
+
+Uso (a partir da raiz do repositório)::
+
+    python -m agents.batch_runner perguntas.txt -o respostas.jsonl -c 8
+    cat perguntas.txt | python -m agents.batch_runner - -o respostas.jsonl
+
+A entrada é lida em streaming: uma pergunta por linha, ou JSONL com
+`{"id": ..., "question": ...}`.  Até `--concurrency` perguntas rodam ao mesmo
+tempo via `Crew.kickoff_async`; cada resposta é gravada (e o arquivo
+`flush`ado) assim que termina, com custo, tokens e latência.  Linhas saem na
+ordem de término – use o campo `id` para casar com a entrada.  Linha JSONL
+inválida (ou sem `question`) vira um registro com `error` e o número da
+linha, sem parar o lote.
+
+A chave vem de `OPENAI_API_KEY` no ambiente (ou `.env`).
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Dict, Iterator, Optional
+
+from agents.model_router import route_model
+from furiachat.utils.ledger import UsageLedger
+
+
+def iter_questions(stream: IO[str]) -> Iterator[Dict[str, Optional[str]]]:
+    """Lê perguntas linha a linha (texto puro ou JSONL).
+
+    Linhas JSONL ruins saem como `{"id", "question": None, "error"}`.
+    """
+    for lineno, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("{"):
+            try:
+                item = json.loads(line)
+                yield {"id": str(item.get("id", lineno)), "question": item["question"]}
+            except (json.JSONDecodeError, KeyError, AttributeError) as exc:
+                yield {"id": str(lineno), "question": None,
+                       "error": f"linha {lineno}: {type(exc).__name__}: {exc}"}
+        else:
+            yield {"id": str(lineno), "question": line}
+
+
+async def _answer_one(item: Dict[str, str], api_key: str, model: Optional[str],
+                      ledger: Optional[UsageLedger] = None) -> Dict:
+    record: Dict = {"id": item["id"], "question": item["question"]}
+    if item.get("error"):  # linha de entrada inválida: nada a perguntar
+        return {**record, "error": item["error"], "latency_s": 0.0}
+    from agents.hltv_agents import arun_pantera_task  # CrewAI só ao rodar (não no --help)
+
+    started = time.perf_counter()
+    try:
+        record.update(await arun_pantera_task(item["question"], api_key, model))
+        record["error"] = None
+    except Exception as exc:  # uma pergunta ruim não derruba o lote
+        record["error"] = f"{type(exc).__name__}: {exc}"
+        record["model"] = model or route_model(item["question"])  # agrupa o erro no ledger
+    record["latency_s"] = round(time.perf_counter() - started, 3)
+    if ledger is not None:
+        try:
+            await asyncio.to_thread(ledger.record, item["question"], record, "batch",
+                                    record["latency_s"], record["error"])
+        except Exception as exc:  # ledger travado não pode custar a resposta já paga
+            record["ledger_error"] = f"{type(exc).__name__}: {exc}"
+    return record
+
+
+async def run_batch(
+    questions: Iterator[Dict[str, str]],
+    out: IO[str],
+    api_key: str,
+    concurrency: int = 4,
+    model: Optional[str] = None,
+    ledger: Optional[UsageLedger] = None,
+) -> Dict[str, float]:
+    """Responde `questions` com no máximo `concurrency` kickoffs simultâneos.
+
+    Só `concurrency` perguntas ficam em memória por vez; a leitura da entrada
+    pausa enquanto não há vaga.
+    """
+    loop = asyncio.get_running_loop()
+    # kickoff_async roda em to_thread: o pool precisa comportar a concorrência
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=concurrency))
+
+    slots = asyncio.Semaphore(concurrency)
+    pending: set[asyncio.Task] = set()
+    stats = {"answered": 0, "errors": 0, "usd_cost": 0.0}
+    started = time.perf_counter()
+
+    def write(task: asyncio.Task, item: Dict[str, str]) -> None:
+        pending.discard(task)
+        slots.release()
+        try:
+            record = task.result()
+        except BaseException as exc:  # inclui cancelamento: a linha sai mesmo assim
+            record = {"id": item["id"], "question": item["question"],
+                      "error": f"{type(exc).__name__}: {exc}"}
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        out.flush()
+        stats["answered"] += 1
+        stats["errors"] += record["error"] is not None
+        stats["usd_cost"] += record.get("usd_cost", 0.0)
+
+    while True:
+        await slots.acquire()
+        item = await asyncio.to_thread(next, questions, None)
+        if item is None:
+            slots.release()
+            break
+        task = asyncio.create_task(_answer_one(item, api_key, model, ledger))
+        pending.add(task)
+        task.add_done_callback(lambda t, item=item: write(t, item))
+
+    if pending:
+        await asyncio.wait(set(pending))
+    stats["wall_s"] = round(time.perf_counter() - started, 3)
+    stats["usd_cost"] = round(stats["usd_cost"], 6)
+    return stats
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Responde um arquivo de perguntas sobre a FURIA e grava JSONL.")
+    parser.add_argument("input", help="arquivo de perguntas ou '-' para stdin")
+    parser.add_argument("-o", "--output", default="-",
+                        help="arquivo JSONL de saída (padrão: stdout)")
+    parser.add_argument("-c", "--concurrency", type=int, default=4)
+    parser.add_argument("-m", "--model", default=None,
+                        help="fixa o modelo (padrão: roteamento por complexidade)")
+    parser.add_argument("-a", "--append", action="store_true",
+                        help="acrescenta ao arquivo de saída em vez de sobrescrever")
+    parser.add_argument("--ledger", default=None,
+                        help="grava cada execução no ledger SQLite de uso")
+    args = parser.parse_args(argv)
+
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
+    api_key = os.environ.get("OPENAI_API_KEY")
+    if not api_key:
+        parser.error("defina OPENAI_API_KEY no ambiente")
+
+    src = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    dst = sys.stdout if args.output == "-" else open(
+        args.output, "a" if args.append else "w", encoding="utf-8")
+    try:
+        stats = asyncio.run(run_batch(
+            iter_questions(src), dst, api_key, max(1, args.concurrency), args.model,
+            UsageLedger(args.ledger) if args.ledger else None))
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+    print(json.dumps(stats), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
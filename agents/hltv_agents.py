@@ -2,33 +2,101 @@
 """HLTV agents e tasks para o Pantera‑Bot.
 
 • **HLTVScraperTool** – wrapper finíssimo sobre utilitário de raspagem.
+• **HLTVBatchScraperTool** – várias URLs/endpoints numa chamada só, baixadas
+  em paralelo (com limite) e devolvidas num JSON compacto com erros por URL.
 • **build_pantera_agent()** – cria o agente principal que usa o scraper
   para responder perguntas factuais sobre a FURIA.
 • **run_pantera_task()** – função helper que recebe `question` e retorna
-  dicionário {answer, tokens, usd_cost} – pronto p/ UI Streamlit.
+  dicionário {answer, tokens, usd_cost, model, intent, tool_calls, flags de
+  cache} – pronto p/ UI Streamlit e para o `UsageLedger`.
+• **arun_pantera_task()** – mesma coisa via `Crew.kickoff_async`, para
+  rodar várias perguntas em paralelo (ver `agents.batch_runner`).
 
-O modelo utilizado é gpt‑3.5‑turbo, mas pode ser alterado via kwargs.
+Cada task recebe o snapshot compacto da FURIA (roster, próximos jogos,
+resultados, mapas) já no prompt; o scraper fica para consultas profundas.
+
+O modelo é escolhido por `agents.model_router` conforme a complexidade da
+pergunta (e escalado se o laço de ferramentas falhar), mas pode ser fixado
+via kwargs.
 """
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import os
 import json
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Tuple
 
 from pydantic import BaseModel, Field
-from crewai import Agent, Task, Crew
+from crewai import Agent, Task, Crew, LLM
 from crewai.tools import BaseTool
 
-from furiachat.src.furiachat.tools.hltv_scraper import (
+from furiachat.src.furiachat.tools.hltv import (
+    HLTV_BASE,
+    STATS_URL,
+    TEAM_URL,
+    discover_links,
+    NoParserError,
     fetch_html,
-    parse_team_overview,
-    parse_match_summary,
+    parse,
+    registry,
+)
+from furiachat.src.furiachat.tools.context_snapshot import (
+    get_context_snapshot,
+    peek_context_snapshot,
+    snapshot_to_prompt,
 )
 from furiachat.utils.usage import usage_to_dict
-from furiachat.utils.cost import gpt4o_mini_cost
+from furiachat.utils.ledger import question_hash
+from furiachat.utils.tracing import Span, span
+from furiachat.utils.cost import model_cost
+from agents.model_router import MODEL_LADDER, classify_intent, escalate, route_model
 
 # ─────────────────────  Tool  ────────────────────── #
 
+MAX_BATCH_URLS = 8       # URLs por chamada da ferramenta em lote
+MAX_BATCH_WORKERS = 4    # downloads simultâneos (educado com a HLTV)
+MAX_LINKS = 30           # links devolvidos para páginas sem parser
+
+# atalhos aceitos no lugar de URLs completas
+ENDPOINTS = {"team": TEAM_URL, "stats": STATS_URL,
+             "team_overview": TEAM_URL, "stats_team": STATS_URL}
+
+
+def _resolve_url(target: str) -> str:
+    """URL completa a partir de URL, caminho (`/matches/...`) ou atalho."""
+    target = target.strip()
+    if target in ENDPOINTS:
+        return ENDPOINTS[target]
+    if target.startswith("/"):
+        return HLTV_BASE + target
+    return target
+
+
+def _scrape(url: str) -> Dict[str, Any]:
+    """Escolhe o parser registrado pela rota da URL e devolve o dict parseado."""
+    with span("tool.scrape", url=url):
+        try:
+            spec = registry.match(url)
+        except NoParserError:
+            spec = None
+        if spec is None:
+            # sem parser: só os links internos úteis, nunca o HTML cru
+            data = {"links": sorted(discover_links(url=url))[:MAX_LINKS]}
+        else:
+            # erro do parser (marcação mudou) sobe para o chamador / `errors`
+            data = parse(url, spec.name)
+    data.pop("source", None)
+    return data
+
+
+def _to_json(payload: Any) -> str:
+    with span("tool.json_encode") as sp:
+        text = json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=str)
+        sp.set_attribute("bytes", len(text))
+    return text
+
 
 class HLTVToolInput(BaseModel):
     url: str = Field(..., description="URL pública da HLTV a ser raspada")
@@ -45,21 +113,70 @@ class HLTVScraperTool(BaseTool):
         "Raspa páginas da HLTV relacionadas ao time FURIA e devolve JSON com dados estruturados"
     )
     args_schema: type = HLTVToolInput
+    calls: int = 0
 
     def _run(self, url: str) -> str:  # type: ignore[override]
-        html = fetch_html(url)
-        if "/team/" in url:
-            data = parse_team_overview(html, url)
-        elif "/matches/" in url:
-            data = parse_match_summary(html, url)
-        else:
-            data = {"url": url, "raw_html": html}
-        return json.dumps(data, ensure_ascii=False)
+        self.calls += 1
+        with span("tool.hltv_scraper", url=url):
+            url = _resolve_url(url)
+            return _to_json({"url": url, **_scrape(url)})
+
+
+class HLTVBatchToolInput(BaseModel):
+    urls: List[str] = Field(
+        ...,
+        description=(
+            f"Até {MAX_BATCH_URLS} URLs da HLTV, caminhos (/matches/...) ou atalhos "
+            "('team', 'stats')"
+        ),
+    )
+
+
+class HLTVBatchScraperTool(BaseTool):
+    """Várias páginas HLTV numa chamada: uma iteração do agente em vez de N.
+
+    Downloads em paralelo (até `MAX_BATCH_WORKERS`), cada um no contexto
+    do span da ferramenta; falha numa URL vira entrada em `errors`.
+    """
+
+    name: str = "hltv_batch_scraper"
+    description: str = (
+        "Raspa VÁRIAS páginas da HLTV de uma vez (ex.: 3 partidas) e devolve um JSON "
+        "{results: {url: dados}, errors: {url: erro}}. Prefira-a ao hltv_scraper "
+        "sempre que precisar de mais de uma página."
+    )
+    args_schema: type = HLTVBatchToolInput
+    calls: int = 0
+
+    def _run(self, urls: List[str]) -> str:  # type: ignore[override]
+        self.calls += 1
+        targets = list(dict.fromkeys(_resolve_url(u) for u in urls if u.strip()))
+        skipped = targets[MAX_BATCH_URLS:]
+        targets = targets[:MAX_BATCH_URLS]
+        with span("tool.hltv_batch_scraper", urls=len(targets)) as sp:
+            with ThreadPoolExecutor(max_workers=min(MAX_BATCH_WORKERS, len(targets) or 1)) as pool:
+                # um contexto por tarefa: os spans de cada URL ficam sob este
+                futures = {url: pool.submit(contextvars.copy_context().run, _scrape, url)
+                           for url in targets}
+            results: Dict[str, Any] = {}
+            errors: Dict[str, str] = {}
+            for url, future in futures.items():
+                try:
+                    results[url] = future.result()
+                except Exception as exc:
+                    errors[url] = f"{type(exc).__name__}: {exc}"
+            for url in skipped:
+                errors[url] = f"ignorada: limite de {MAX_BATCH_URLS} URLs por chamada"
+            sp.set_attribute("errors", len(errors))
+            return _to_json({"results": results, "errors": errors})
 
 
 # ─────────────────────  Agent builder  ────────────────────── #
 
-def build_pantera_agent(openai_api_key: str, model: str = "gpt-3.5-turbo") -> Agent:
+MAX_ITER = 4
+
+
+def build_pantera_agent(openai_api_key: str, model: str = MODEL_LADDER[0]) -> Agent:
     """Cria agente com o HLTVScraperTool embutido."""
 
     os.environ["OPENAI_API_KEY"] = openai_api_key
@@ -71,44 +188,154 @@ def build_pantera_agent(openai_api_key: str, model: str = "gpt-3.5-turbo") -> Ag
         ),
         backstory=(
             "Você é um bot apaixonado por e‑sports que conhece a estrutura da HLTV. "
-            "Quando necessário, chama o HLTVScraperTool para obter dados atualizados."
+            "Você já recebe um snapshot atualizado da FURIA (roster, próximos jogos, "
+            "resultados recentes e mapas); responda direto dele sempre que possível e "
+            "só chame as ferramentas para detalhes fora do snapshot (partidas "
+            "específicas, notícias, histórico).  Para várias páginas, use uma única "
+            "chamada do hltv_batch_scraper."
         ),
-        tools=[HLTVScraperTool()],
+        tools=[HLTVScraperTool(), HLTVBatchScraperTool()],
         allow_delegation=False,
         verbose=False,
-        max_iter=4,
-        llm_config={
-            "model": model,
-            "temperature": 0,
-        },
+        max_iter=MAX_ITER,
+        # prefixo explícito: o LiteLLM fixado não mapeia os modelos gpt-4.1*
+        llm=LLM(model=model if "/" in model else f"openai/{model}", temperature=0),
     )
 
 
 # ─────────────────────  Task runner  ────────────────────── #
 
-def run_pantera_task(question: str, openai_api_key: str, model: str = "gpt-4o-mini") -> Dict[str, Any]:
-    """Executa um único ciclo pergunta→resposta usando CrewAI."""
+def _tool_loop_failed(agent: Agent, answer: str) -> bool:
+    """O agente gastou todas as iterações em ferramentas ou não respondeu."""
+    calls = sum(getattr(t, "calls", 0) for t in agent.tools)
+    return calls >= MAX_ITER or not answer.strip()
+
+
+def _build_context(history: str) -> Tuple[str, bool]:
+    """Bloco de contexto do prompt e se o snapshot veio do cache em memória."""
+    cached = peek_context_snapshot()
+    snapshot = get_context_snapshot()
+    context = f"{snapshot_to_prompt(snapshot)}\n\n" if snapshot else ""
+    if history:
+        context += f"Histórico da conversa (use para resolver referências):\n{history}\n\n"
+    return context, snapshot is not None and snapshot is cached
 
-    agent = build_pantera_agent(openai_api_key, model)
 
+def _build_crew(question: str, openai_api_key: str, model: str, context: str) -> Tuple[Agent, Crew]:
+    agent = build_pantera_agent(openai_api_key, model)
     task = Task(
         description=(
+            f"{context}"
             f"Responda à pergunta a seguir em português, citando a URL de onde o dado foi extraído. "
+            f"Se o contexto acima já contém a resposta, não chame ferramentas. "
             f"Pergunta: {question}"
         ),
         expected_output="Resposta curta em Markdown, com link fonte entre parênteses.",
         agent=agent,
     )
+    return agent, Crew(agents=[agent], tasks=[task], verbose=False)
+
+
+_TOKEN_KEYS = ("prompt_tokens", "completion_tokens", "cached_prompt_tokens", "total_tokens")
 
-    crew = Crew(agents=[agent], tasks=[task], verbose=False)
-    result = crew.kickoff()
 
+def _empty_totals(question: str, snapshot_hit: bool) -> Dict[str, Any]:
+    cache = fetch_html.cache_info()
+    return {
+        "usd_cost": 0.0,
+        **dict.fromkeys(_TOKEN_KEYS, 0),
+        "tool_calls": 0,
+        "intent": classify_intent(question),
+        "snapshot_hit": snapshot_hit,
+        # contadores globais do lru_cache – aproximados sob concorrência
+        "html_cache_hits": -cache.hits,
+        "html_cache_misses": -cache.misses,
+    }
+
+
+def _add_usage(totals: Dict[str, Any], result, model: str, agent: Agent, sp: Span) -> None:
     # Extrair métricas de uso
     tok_dict = usage_to_dict(result.token_usage)
-    usd_cost = gpt4o_mini_cost(tok_dict)
+    totals["usd_cost"] += model_cost(tok_dict, model)
+    for key in _TOKEN_KEYS:
+        totals[key] += tok_dict[key]
+        sp.set_attribute(key, tok_dict[key])
+    calls = sum(getattr(t, "calls", 0) for t in agent.tools)
+    totals["tool_calls"] += calls
+    sp.set_attribute("tool_calls", calls)
+    sp.set_attribute("llm_requests", getattr(result.token_usage, "successful_requests", None))
+
 
+def _answer(result, model: str, totals: Dict[str, Any], root: Span) -> Dict[str, Any]:
+    cache = fetch_html.cache_info()
+    root.set_attribute("model", model)
+    root.set_attribute("intent", totals["intent"])
+    root.set_attribute("total_tokens", totals["total_tokens"])
     return {
         "answer": str(result),
-        "usd_cost": usd_cost,
-        "total_tokens": tok_dict["total_tokens"],
+        **totals,
+        "usd_cost": round(totals["usd_cost"], 6),
+        "html_cache_hits": totals["html_cache_hits"] + cache.hits,
+        "html_cache_misses": totals["html_cache_misses"] + cache.misses,
+        "model": model,
+        "trace_id": root.trace_id,
     }
+
+
+def run_pantera_task(
+    question: str,
+    openai_api_key: str,
+    model: str | None = None,
+    history: str = "",
+) -> Dict[str, Any]:
+    """Executa um único ciclo pergunta→resposta usando CrewAI.
+
+    `history` é o bloco renderizado por `ConversationMemory.render()`; permite
+    perguntas de continuação ("e o jogo depois desse?").
+
+    Sem `model`, o roteador escolhe o modelo pela complexidade da pergunta; se
+    o laço de ferramentas falhar (ou a resposta vier vazia), a pergunta é
+    refeita no próximo modelo da escada e o custo soma todas as tentativas.
+    Exceções do `kickoff` (chave inválida, rede, configuração) não escalam:
+    sobem na primeira tentativa.  `trace_id` no retorno aponta
+    para os spans em `furiachat.utils.tracing.get_trace`.
+    """
+
+    model = model or route_model(question)
+    with span("pantera.run_task", question_hash=question_hash(question)) as root:
+        context, snapshot_hit = _build_context(history)
+        totals = _empty_totals(question, snapshot_hit)
+        while True:
+            agent, crew = _build_crew(question, openai_api_key, model, context)
+            next_model = escalate(model)
+            # erros de auth/rede/config sobem direto: outro modelo não resolve
+            with span("crew.kickoff", model=model) as sp:
+                result = crew.kickoff()
+                _add_usage(totals, result, model, agent, sp)
+            if next_model is None or not _tool_loop_failed(agent, str(result)):
+                return _answer(result, model, totals, root)
+            model = next_model
+
+
+async def arun_pantera_task(
+    question: str,
+    openai_api_key: str,
+    model: str | None = None,
+    history: str = "",
+) -> Dict[str, Any]:
+    """Versão assíncrona de `run_pantera_task` (usa `Crew.kickoff_async`)."""
+
+    model = model or route_model(question)
+    with span("pantera.run_task", question_hash=question_hash(question)) as root:
+        context, snapshot_hit = await asyncio.to_thread(_build_context, history)
+        totals = _empty_totals(question, snapshot_hit)
+        while True:
+            agent, crew = _build_crew(question, openai_api_key, model, context)
+            next_model = escalate(model)
+            # erros de auth/rede/config sobem direto: outro modelo não resolve
+            with span("crew.kickoff", model=model) as sp:
+                result = await crew.kickoff_async()
+                _add_usage(totals, result, model, agent, sp)
+            if next_model is None or not _tool_loop_failed(agent, str(result)):
+                return _answer(result, model, totals, root)
+            model = next_model
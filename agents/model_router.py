@@ -0,0 +1,78 @@
+# furiachat/agents/model_router.py
+"""Roteamento de modelo por complexidade da pergunta.
+
+• **classify_complexity()** – heurística barata (sem LLM) que separa consultas
+  simples ("quando é o próximo jogo?") de análises (várias partidas,
+  comparações, tendências).
+• **route_model()** – escolhe o modelo mais barato/rápido capaz de responder.
+• **escalate()** – próximo degrau da escada quando o laço de ferramentas
+  falha com o modelo atual.
+• **classify_intent()** – assunto da pergunta (próximo jogo, resultados,
+  estatísticas…), usado para agregar custo/latência no ledger de uso.
+
+A escada vai do mais barato ao mais capaz; os preços ficam em
+`furiachat.utils.cost.MODEL_PRICES`.
+"""
+from __future__ import annotations
+
+import re
+from typing import Optional
+
+SIMPLE = "simple"
+COMPLEX = "complex"
+
+# do mais barato/rápido ao mais capaz
+MODEL_LADDER = ("gpt-4o-mini", "gpt-4.1-mini", "gpt-4o")
+START_TIER = {SIMPLE: 0, COMPLEX: 1}
+
+_COMPLEX_PATTERNS = re.compile(
+    r"compar|analis|análise|por ?que|tend[eê]ncia|evolu|hist[oó]ric|"
+    r"m[ée]dia|desempenho|estat[ií]stica.+(mapa|jogador)|"
+    r"[uú]ltim[oa]s \d+|\bvs\.?\b|versus|melhor(es)? .*(mapa|jogador)|"
+    r"explique|resum[ao] (d[ao]s|das) partidas",
+    re.IGNORECASE,
+)
+_MAX_SIMPLE_WORDS = 25
+
+
+def classify_complexity(question: str) -> str:
+    """Classifica a pergunta em `SIMPLE` ou `COMPLEX`."""
+    text = question.strip()
+    if text.startswith("/"):  # comandos (/nextmatch) são sempre consultas diretas
+        return SIMPLE
+    if len(text.split()) > _MAX_SIMPLE_WORDS or text.count("?") > 1:
+        return COMPLEX
+    return COMPLEX if _COMPLEX_PATTERNS.search(text) else SIMPLE
+
+
+def route_model(question: str) -> str:
+    """Modelo inicial para a pergunta."""
+    return MODEL_LADDER[START_TIER[classify_complexity(question)]]
+
+
+def escalate(model: str) -> Optional[str]:
+    """Próximo modelo da escada, ou `None` se já está no topo (ou fora dela)."""
+    try:
+        idx = MODEL_LADDER.index(model)
+    except ValueError:
+        return None
+    return MODEL_LADDER[idx + 1] if idx + 1 < len(MODEL_LADDER) else None
+
+
+# ─────────────────────  Intent  ────────────────────── #
+
+_INTENTS = (
+    ("next_match", re.compile(r"pr[oó]xim[oa]|quando (é|joga)|agenda|/nextmatch", re.I)),
+    ("results", re.compile(r"resultado|placar|ganh|perd|venceu|[uú]ltim[oa] (jogo|partida)", re.I)),
+    ("stats", re.compile(r"rating|estat[ií]stica|mapa|k/?d|win.?rate|desempenho", re.I)),
+    ("roster", re.compile(r"roster|lineup|line-up|elenco|jogadores|escala[cç][aã]o|coach|t[eé]cnico", re.I)),
+    ("news", re.compile(r"not[ií]cia|news|novidade|contrat|transfer", re.I)),
+)
+
+
+def classify_intent(question: str) -> str:
+    """Primeiro assunto reconhecido na pergunta, ou "other"."""
+    for intent, pattern in _INTENTS:
+        if pattern.search(question):
+            return intent
+    return "other"
@@ -4,25 +4,96 @@ Streamlit UI + orquestração do agente de chat da Fúria
 """
 import streamlit as st
 import base64
-from agents.hltv_agents import run_pantera_task
-from furiachat.utils.excel_report import build_audit_excel
+import importlib
+import threading
+import time
+import uuid
+from agents.model_router import route_model
+from furiachat.utils.ledger import UsageLedger
+from furiachat.utils.memory import ConversationMemory
+from furiachat.utils.tracing import get_trace, waterfall_rows
 
 st.set_page_config(
     page_title="FuriaChat – Pantera-Bot", layout="centered")
 
+
+@st.cache_resource
+def get_ledger() -> UsageLedger:
+    return UsageLedger()
+
+
+def _preload() -> None:
+    importlib.import_module("agents.hltv_agents")
+    # snapshot da FURIA pronto antes da primeira pergunta
+    importlib.import_module(
+        "furiachat.src.furiachat.tools.context_snapshot").warm_context_snapshot()
+
+
+@st.cache_resource
+def preload_agents() -> threading.Thread:
+    """Importa CrewAI/LiteLLM e aquece o snapshot em segundo plano: a página não espera por eles."""
+    thread = threading.Thread(target=_preload, daemon=True)
+    thread.start()
+    return thread
+
+
+ledger = get_ledger()
+preload_agents()
+if "session_id" not in st.session_state:
+    st.session_state.session_id = uuid.uuid4().hex[:12]
+
 with st.sidebar:
     st.header("🔑 Chaves de API")
     OPENAI_API_KEY = st.text_input("OPENAI_API_KEY", type="password")
     # MODULE_API_KEY = st.text_input( "MODULE_API_KEY", type="password")  # futuro uso
 
+    st.header("🧠 Memória")
+    HISTORY_BUDGET = st.number_input(
+        "Orçamento de tokens do histórico", min_value=0, max_value=4000, value=800, step=100)
+    if st.button("Limpar conversa"):
+        st.session_state.pop("memory", None)
+        st.session_state.pop("messages", None)
+
+    with st.expander("📊 Uso (últimas 24 h)"):
+        since = time.time() - 24 * 3600
+        totals = ledger.totals(since)
+        st.metric("Custo", f"US$ {totals['usd_cost'] or 0:.4f}",
+                  f"{totals['runs']} perguntas", delta_color="off")
+        st.caption(f"Latência média: {totals['avg_wall_s'] or 0:.1f} s")
+        st.caption("Por intenção")
+        st.dataframe(ledger.by_intent(since), hide_index=True)
+        st.caption("Por modelo")
+        st.dataframe(ledger.by_model(since), hide_index=True)
+        st.caption("Por hora")
+        st.dataframe(ledger.by_hour(since, limit=24), hide_index=True)
+
+# Memória por sessão: janela de turnos recentes + resumo dos antigos
+if "memory" not in st.session_state:
+    st.session_state.memory = ConversationMemory(token_budget=HISTORY_BUDGET)
+    st.session_state.messages = []
+memory: ConversationMemory = st.session_state.memory
+memory.token_budget = HISTORY_BUDGET
+
 st.title("😼 =FuriaChat= 💬")
 
+for role, content in st.session_state.messages:
+    st.chat_message(role).markdown(content)
+
 user_q = st.chat_input("Pergunte sobre a FURIA...")
 
 if user_q:
+    st.chat_message("user").markdown(user_q)
+    answer = None
     with st.spinner("Consultando..."):
+        started = time.perf_counter()
+        model = route_model(user_q)  # fora do try: o ledger registra o modelo mesmo com erro
         try:
-            answer = run_pantera_task(user_q, OPENAI_API_KEY)
+            # já carregado por `preload_agents` (ou espera o import terminar)
+            from agents.hltv_agents import run_pantera_task
+            answer = run_pantera_task(
+                user_q, OPENAI_API_KEY, model=model, history=memory.render())
+            ledger.record(user_q, answer, st.session_state.session_id,
+                          wall_s=time.perf_counter() - started)
             # answer = {                 # mock provisório
             #     "answer": "Fala, torcedor! A próxima partida é amanhã às 15 h vs MOUZ.",
             #     "usd_cost": 0.00023,
@@ -33,6 +104,25 @@ if user_q:
                 f"Custo da tarefa: **US$ {answer['usd_cost']:.6f}** " f"({answer['total_tokens']} tokens)")
 
         except Exception as e:
+            ledger.record(user_q, {"model": model}, st.session_state.session_id,
+                          wall_s=time.perf_counter() - started, error=str(e))
             st.error(f"Erro: {e}")
 
-    st.chat_message("assistant").markdown(answer["answer"])
+    if answer:
+        st.chat_message("assistant").markdown(answer["answer"])
+        rows = waterfall_rows(get_trace(answer.get("trace_id", "")))
+        if rows:
+            with st.expander("🐞 Trace (debug)"):
+                import altair as alt
+                chart = alt.Chart(alt.Data(values=rows)).mark_bar().encode(
+                    x=alt.X("start_ms:Q", title="ms"),
+                    x2="end_ms:Q",
+                    y=alt.Y("span:N", sort=None, title=None),
+                    color="status:N",
+                    tooltip=["span:N", "duration_ms:Q", "attributes:N"],
+                )
+                st.altair_chart(chart, use_container_width=True)
+                st.dataframe(rows, hide_index=True)
+        memory.add_turn(user_q, answer["answer"])
+        st.session_state.messages += [("user", user_q),
+                                      ("assistant", answer["answer"])]
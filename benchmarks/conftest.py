@@ -0,0 +1,139 @@
+# benchmarks/conftest.py
+"""
+Infra dos benchmarks offline: `fetch_html` falso, rede bloqueada, tracing
+desligado e baseline de memória (tracemalloc) com limiar de regressão.
+
+Opções:
+    --memory-threshold=0.25   regressão tolerada sobre o baseline (25 %)
+    --memory-update           regrava `baselines/memory.json`
+"""
+from __future__ import annotations
+
+import gc
+import json
+import os
+import platform
+import sys
+import tracemalloc
+from typing import Callable, Dict
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+MEMORY_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "memory.json")
+BLOCKS_SLACK = 50  # ruído absoluto tolerado em blocos retidos
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("hltv-bench")
+    group.addoption("--memory-threshold", type=float, default=0.25,
+                    help="regressão relativa tolerada sobre o baseline de memória")
+    group.addoption("--memory-update", action="store_true",
+                    help="regrava benchmarks/baselines/memory.json com as medições atuais")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _no_trace_export():
+    from furiachat.utils import tracing
+
+    tracing.configure(None)  # benchmarks não exportam spans, mesmo com FURIACHAT_TRACE_FILE
+    yield
+
+
+@pytest.fixture
+def fake_fetch(monkeypatch):
+    """Troca `hltv.engine.fetch_html` pelo corpus offline e bloqueia a rede."""
+    from furiachat.src.furiachat.tools.hltv import engine
+    from hltv_fixtures import FakeFetch
+
+    def _offline(*args, **kwargs):
+        raise RuntimeError("benchmarks rodam offline: acesso à rede bloqueado")
+
+    fake = FakeFetch()
+    monkeypatch.setattr(engine, "fetch_html", fake)
+    monkeypatch.setattr(engine.engine.session, "get", _offline)
+    return fake
+
+
+# ───────────────────────── MEMÓRIA ───────────────────────── #
+
+def _measure(func: Callable[[], object]) -> Dict[str, float]:
+    """Pico de memória e blocos retidos pelo resultado de uma chamada."""
+    func()  # aquece caches de seletores / parser fora da medição
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+        gc.collect()  # a árvore do BeautifulSoup é cíclica: só sai no GC
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    diff = after.compare_to(before, "filename")
+    retained = [s for s in diff if s.size_diff > 0]
+    del result
+    return {
+        "peak_kib": round(peak / 1024, 1),
+        "retained_kib": round(sum(s.size_diff for s in retained) / 1024, 1),
+        "retained_blocks": sum(s.count_diff for s in retained),
+    }
+
+
+class MemoryBaseline:
+    def __init__(self, path: str, threshold: float, update: bool):
+        self.path = path
+        self.threshold = threshold
+        self.update = update
+        self.measured: Dict[str, Dict] = {}
+        try:
+            with open(path, encoding="utf-8") as fh:
+                self.cases = json.load(fh).get("cases", {})
+        except FileNotFoundError:
+            self.cases = {}
+
+    def measure(self, case: str, func: Callable[[], object]) -> Dict[str, float]:
+        """Mede `func` e falha se passar do baseline; devolve as medições."""
+        current = _measure(func)
+        self.measured[case] = current
+        self._check(case, current)
+        return current
+
+    def _check(self, case: str, current: Dict[str, float]) -> None:
+        base = self.cases.get(case)
+        if self.update or not base:
+            return
+        limit_peak = base["peak_kib"] * (1 + self.threshold)
+        limit_blocks = base["retained_blocks"] * (1 + self.threshold) + BLOCKS_SLACK
+        problems = []
+        if current["peak_kib"] > limit_peak:
+            problems.append(f"pico {current['peak_kib']} KiB > {limit_peak:.1f} KiB")
+        if current["retained_blocks"] > limit_blocks:
+            problems.append(f"blocos retidos {current['retained_blocks']} > {limit_blocks:.0f}")
+        if problems:
+            pytest.fail(f"regressão de memória em {case}: " + "; ".join(problems)
+                        + " (use --memory-update se for intencional)")
+
+    def save(self) -> None:
+        if not (self.update and self.measured):
+            return
+        self.cases.update(self.measured)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as fh:
+            json.dump({"python": platform.python_version(), "cases": dict(sorted(self.cases.items()))},
+                      fh, indent=2, ensure_ascii=False)
+            fh.write("\n")
+
+
+@pytest.fixture(scope="session")
+def memory_baseline(request):
+    # defaults explícitos: as opções só existem se este conftest for inicial
+    baseline = MemoryBaseline(MEMORY_BASELINE,
+                              request.config.getoption("--memory-threshold", 0.25),
+                              request.config.getoption("--memory-update", False))
+    yield baseline
+    baseline.save()
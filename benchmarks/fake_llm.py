@@ -0,0 +1,174 @@
+# benchmarks/fake_llm.py
+"""
+Servidor local compatível com a API da OpenAI (`/v1/chat/completions`) para
+testes de carga offline.
+
+Responde no formato ReAct que o CrewAI espera: nas primeiras `tool_rounds`
+chamadas de uma conversa devolve uma `Action: hltv_scraper` apontando para
+uma página do corpus gravado; depois, um `Final Answer`.  A latência simula
+um LLM real: `latency_ms` até o primeiro token + `completion_tokens /
+tokens_per_s`.  O `usage` (prompt ≈ caracteres / 4) é devolvido para o
+cálculo de custo seguir funcionando.
+
+    python benchmarks/fake_llm.py --port 8765 --latency-ms 400 --tokens-per-s 80
+    export OPENAI_API_BASE=http://127.0.0.1:8765/v1
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Sequence, Tuple
+
+from hltv_fixtures import MATCH_URL, NEWS_URL, TEAM_URL
+
+DEFAULT_TOOL_URLS = (MATCH_URL, NEWS_URL, TEAM_URL)
+
+
+@dataclass
+class FakeLLMConfig:
+    latency_ms: float = 300.0       # tempo até o primeiro token
+    tokens_per_s: float = 100.0     # vazão da geração
+    tool_rounds: int = 1            # chamadas de ferramenta antes da resposta final
+    tool_urls: Sequence[str] = DEFAULT_TOOL_URLS
+
+
+def _chars_to_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def _reply(messages: List[Dict], config: FakeLLMConfig) -> str:
+    # o CrewAI devolve cada passo (Action + Observation) como mensagem "assistant"
+    rounds = sum(1 for m in messages if m.get("role") == "assistant")
+    if rounds < config.tool_rounds:
+        url = config.tool_urls[rounds % len(config.tool_urls)]
+        return (
+            "Thought: Preciso de dados da HLTV além do snapshot.\n"
+            "Action: hltv_scraper\n"
+            f"Action Input: {json.dumps({'url': url})}"
+        )
+    return (
+        "Thought: I now know the final answer\n"
+        "Final Answer: A FURIA venceu a MOUZ por 2 a 1, com destaque para KSCERATO "
+        f"({TEAM_URL})."
+    )
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "FakeLLMServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args) -> None:  # silencioso sob carga
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str = "application/json") -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.path.rstrip("/").endswith("/models"):
+            self._send(200, json.dumps({"object": "list", "data": []}).encode())
+        else:
+            self._send(404, b"{}")
+
+    def do_POST(self) -> None:
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send(404, b"{}")
+            return
+        request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        config = self.server.config
+        messages = request.get("messages", [])
+        content = _reply(messages, config)
+        prompt_tokens = sum(_chars_to_tokens(str(m.get("content") or "")) for m in messages)
+        completion_tokens = _chars_to_tokens(content)
+
+        time.sleep(config.latency_ms / 1000 + completion_tokens / config.tokens_per_s)
+        self.server.count()
+
+        created = int(time.time())
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        model = request.get("model", "gpt-4o-mini")
+        usage = {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                 "total_tokens": prompt_tokens + completion_tokens}
+
+        if request.get("stream"):
+            chunks = [
+                {"choices": [{"index": 0, "delta": {"role": "assistant", "content": content},
+                              "finish_reason": None}]},
+                {"choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}], "usage": usage},
+            ]
+            body = b"".join(
+                b"data: " + json.dumps({"id": completion_id, "object": "chat.completion.chunk",
+                                        "created": created, "model": model, **chunk}).encode() + b"\n\n"
+                for chunk in chunks
+            ) + b"data: [DONE]\n\n"
+            self._send(200, body, "text/event-stream")
+            return
+
+        self._send(200, json.dumps({
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": created,
+            "model": model,
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": content}}],
+            "usage": usage,
+        }).encode())
+
+
+class FakeLLMServer(ThreadingHTTPServer):
+    """`ThreadingHTTPServer` com config mutável e contador de requisições."""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, address: Tuple[str, int], config: FakeLLMConfig):
+        super().__init__(address, _Handler)
+        self.config = config
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def count(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+
+def start_server(config: FakeLLMConfig, host: str = "127.0.0.1", port: int = 0) -> FakeLLMServer:
+    """Sobe o servidor numa thread daemon (porta 0 = livre) e o devolve."""
+    server = FakeLLMServer((host, port), config)
+    threading.Thread(target=server.serve_forever, name="fake-llm", daemon=True).start()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="LLM falso compatível com OpenAI")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=FakeLLMConfig.latency_ms)
+    parser.add_argument("--tokens-per-s", type=float, default=FakeLLMConfig.tokens_per_s)
+    parser.add_argument("--tool-rounds", type=int, default=FakeLLMConfig.tool_rounds)
+    args = parser.parse_args()
+
+    config = FakeLLMConfig(args.latency_ms, args.tokens_per_s, args.tool_rounds)
+    server = FakeLLMServer((args.host, args.port), config)
+    print(f"LLM falso em {server.base_url}  (Ctrl+C para sair)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
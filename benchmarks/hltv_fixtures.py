@@ -0,0 +1,115 @@
+# benchmarks/hltv_fixtures.py
+"""
+Corpus offline de páginas HLTV para os benchmarks do scraper.
+
+• `PAGES` – URL → arquivo HTML em `fixtures/hltv/` (time, stats, partida,
+  notícia), com a mesma marcação que os seletores de `tools.hltv.parsers` esperam;
+• `build_listing(n)` – página de listagem grande (resultados + notícias),
+  gerada de forma determinística para não versionar megabytes de HTML;
+• `FakeFetch` – substituto de `fetch_html` que serve o corpus e nunca toca a
+  rede (URL desconhecida = erro).
+
+Para trocar os fixtures por páginas reais gravadas:
+
+    python benchmarks/hltv_fixtures.py --record
+"""
+from __future__ import annotations
+
+import os
+import sys
+from functools import lru_cache
+from typing import Dict, Iterable, Optional
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "hltv")
+
+HLTV_BASE = "https://www.hltv.org"
+TEAM_URL = f"{HLTV_BASE}/team/8297/furia"
+STATS_URL = f"{HLTV_BASE}/stats/teams/8297/furia"
+MATCH_URL = f"{HLTV_BASE}/matches/2370000/furia-vs-mouz"
+NEWS_URL = f"{HLTV_BASE}/news/41000/furia-avanca-aos-playoffs"
+LISTING_URL = f"{HLTV_BASE}/results?team=8297"
+
+PAGES: Dict[str, str] = {
+    TEAM_URL: "team_furia.html",
+    STATS_URL: "stats_team_furia.html",
+    MATCH_URL: "match_furia_vs_mouz.html",
+    NEWS_URL: "news_furia_playoffs.html",
+}
+
+LISTING_RESULTS = 2000
+LISTING_NEWS = 500
+
+_OPPONENTS = ("MOUZ", "Vitality", "FaZe", "NAVI", "G2", "Spirit", "Liquid", "paiN")
+_EVENTS = ("IEM Katowice 2025", "BLAST Open Lisbon 2025", "PGL Astana 2025")
+
+
+@lru_cache(maxsize=None)
+def load_page(url: str) -> str:
+    """HTML gravado de `url` (apenas as URLs de `PAGES` e `LISTING_URL`)."""
+    if url == LISTING_URL:
+        return build_listing()
+    with open(os.path.join(FIXTURE_DIR, PAGES[url]), encoding="utf-8") as fh:
+        return fh.read()
+
+
+def build_listing(results: int = LISTING_RESULTS, news: int = LISTING_NEWS) -> str:
+    """Listagem grande no formato de `/results` (sempre o mesmo HTML para o mesmo n)."""
+    rows = []
+    for i in range(results):
+        opponent = _OPPONENTS[i % len(_OPPONENTS)]
+        score = (13, i % 12) if i % 3 else (i % 12, 13)
+        rows.append(
+            f'<a href="/matches/{2300000 + i}/furia-vs-{opponent.lower()}" class="a-reset">'
+            f'<div class="result-con"><table><tr>'
+            f'<td class="team-cell"><div class="team">{opponent}</div></td>'
+            f'<td class="result-score"><span>{score[0]}</span> - <span>{score[1]}</span></td>'
+            f'<td class="event"><span class="event-name">{_EVENTS[i % len(_EVENTS)]}</span></td>'
+            f'</tr></table></div></a>'
+        )
+    headlines = [
+        f'<a href="/news/{40000 + i}/furia-update-{i}" class="newsline">Notícia {i}</a>'
+        for i in range(news)
+    ]
+    return (
+        "<!DOCTYPE html><html><head><title>Results | HLTV.org</title></head><body>"
+        f'<div class="results-holder"><div class="results-sublist">{"".join(rows)}</div></div>'
+        f'<div class="newsfeed">{"".join(headlines)}</div>'
+        "</body></html>"
+    )
+
+
+class FakeFetch:
+    """`fetch_html` offline: serve o corpus e conta as chamadas."""
+
+    def __init__(self, extra: Optional[Dict[str, str]] = None):
+        self.extra = dict(extra or {})
+        self.calls = 0
+
+    def __call__(self, url: str) -> str:
+        self.calls += 1
+        if url in self.extra:
+            return self.extra[url]
+        if url not in PAGES and url != LISTING_URL:
+            raise LookupError(f"sem fixture offline para {url}")
+        return load_page(url)
+
+
+def record(urls: Iterable[str] = tuple(PAGES)) -> None:
+    """Baixa as páginas reais (rede!) e sobrescreve os fixtures."""
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from furiachat.src.furiachat.tools.hltv import fetch_html
+
+    for url in urls:
+        html = fetch_html(url)
+        with open(os.path.join(FIXTURE_DIR, PAGES[url]), "w", encoding="utf-8") as fh:
+            fh.write(html)
+        print(f"{PAGES[url]:<28} {len(html):>9,} bytes  ← {url}")
+
+
+if __name__ == "__main__":
+    if "--record" in sys.argv:
+        record()
+    else:
+        for url, name in PAGES.items():
+            print(f"{name:<28} {len(load_page(url)):>9,} bytes  {url}")
+        print(f"{'(listing gerada)':<28} {len(load_page(LISTING_URL)):>9,} bytes  {LISTING_URL}")
@@ -0,0 +1,111 @@
+# benchmarks/importtime.py
+"""
+Perfil de tempo de import (`python -X importtime`) dos pontos de entrada.
+
+Cada módulo é importado num processo novo (cold start de verdade); a saída
+do `-X importtime` vira um resumo com o tempo total e os pacotes de topo
+mais caros.  Sem argumentos, mede os imports de topo do `app.py` – o que a
+UI paga antes de renderizar.
+
+    python benchmarks/importtime.py                      # imports do app.py
+    python benchmarks/importtime.py agents.hltv_agents --top 10
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple, Sequence, Set
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "app.py")
+
+# dependências que não podem entrar no cold start da UI
+HEAVY = ("crewai", "litellm", "pandas", "pyarrow", "tiktoken", "bs4", "lxml", "openai")
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)$")
+
+
+class ImportRecord(NamedTuple):
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def app_imports(path: str = APP) -> List[str]:
+    """Módulos importados no topo de `app.py` (na ordem do arquivo)."""
+    with open(path, encoding="utf-8") as fh:
+        tree = ast.parse(fh.read())
+    modules: List[str] = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            modules.append(node.module)
+    return modules
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")]))}
+    return subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          capture_output=True, text=True, cwd=ROOT, env=env, check=True)
+
+
+def profile(modules: Sequence[str]) -> List[ImportRecord]:
+    """Importa `modules` num processo novo e devolve os registros do importtime."""
+    proc = _run("".join(f"import {m}\n" for m in modules))
+    records = []
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            records.append(ImportRecord(name, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return records
+
+
+def loaded_modules(modules: Sequence[str]) -> Set[str]:
+    """Pacotes de topo presentes em `sys.modules` depois de importar `modules`."""
+    code = "".join(f"import {m}\n" for m in modules)
+    code += "import json, sys\nprint(json.dumps(sorted({n.split('.')[0] for n in sys.modules})))\n"
+    return set(json.loads(_run(code).stdout))
+
+
+def summarize(records: Sequence[ImportRecord], top: int = 15) -> Dict:
+    roots = [r for r in records if r.depth == 0]
+    ranked = sorted(roots, key=lambda r: r.cumulative_us, reverse=True)[:top]
+    return {
+        "total_ms": round(sum(r.cumulative_us for r in roots) / 1000, 1),
+        "modules": len(records),
+        "top": [{"module": r.name, "cumulative_ms": round(r.cumulative_us / 1000, 1),
+                 "self_ms": round(r.self_us / 1000, 1)} for r in ranked],
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Resumo do -X importtime")
+    parser.add_argument("modules", nargs="*", help="módulos (padrão: imports de topo do app.py)")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--json", action="store_true", help="saída em JSON")
+    args = parser.parse_args(argv)
+
+    modules = args.modules or app_imports()
+    summary = summarize(profile(modules), args.top)
+    summary["heavy_loaded"] = sorted(loaded_modules(modules) & set(HEAVY))
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+    print(f"{', '.join(modules)}\n")
+    print(f"total: {summary['total_ms']:.1f} ms em {summary['modules']} módulos")
+    print(f"pesados carregados: {', '.join(summary['heavy_loaded']) or 'nenhum'}\n")
+    print(f"{'módulo':<40}{'acumulado (ms)':>16}{'próprio (ms)':>14}")
+    for row in summary["top"]:
+        print(f"{row['module']:<40}{row['cumulative_ms']:>16.1f}{row['self_ms']:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
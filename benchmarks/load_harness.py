@@ -0,0 +1,240 @@
+# benchmarks/load_harness.py
+"""
+Teste de carga ponta a ponta do caminho da pergunta (`run_pantera_task`).
+
+Tudo offline numa máquina só:
+• LLM → `fake_llm.FakeLLMServer` (API OpenAI local, latência e tokens/s
+  configuráveis, `tool_rounds` chamadas de ferramenta por pergunta);
+• HLTV → corpus gravado de `hltv_fixtures`, servido no nível do
+  `requests.Session.send` (cache, retry e spans do scraper continuam reais).
+
+N usuários simulados (uma thread cada, como as sessões do Streamlit) fazem
+`--questions` perguntas em sequência.  O relatório traz vazão, latência
+p50/p95/p99 e o tempo por estágio, lido dos spans de `furiachat.utils.tracing`
+(`self` = tempo do span menos o dos filhos; em `crew.kickoff` isso é
+essencialmente LLM + overhead do CrewAI).
+
+    python benchmarks/load_harness.py --users 50 --questions 4 \\
+        --latency-ms 400 --tokens-per-s 80 --tool-rounds 1 --json load.json
+
+`--max-p95-ms` / `--min-throughput` fazem o processo sair com código 1 se o
+limite for violado (para CI / antes de dia de jogo).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+for path in (ROOT, HERE):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from fake_llm import FakeLLMConfig, start_server  # noqa: E402
+from hltv_fixtures import FakeFetch  # noqa: E402
+
+QUESTIONS = (
+    "/nextmatch",
+    "Quem joga na FURIA hoje?",
+    "Qual o rating atual da FURIA?",
+    "Resultado do jogo contra a MOUZ?",
+    "Compare o desempenho da FURIA na Mirage e na Inferno nos últimos meses",
+    "Qual foi a última notícia sobre a lineup?",
+    "Quando é o próximo jogo e contra quem?",
+    "Por que a FURIA perdeu para a Vitality e o que mudou no veto?",
+)
+
+
+# ─────────────────────────── HLTV OFFLINE ───────────────────────────── #
+
+def install_offline_hltv(latency_ms: float = 0.0) -> FakeFetch:
+    """Serve `www.hltv.org` a partir do corpus, no nível do transporte HTTP."""
+    import requests
+
+    fake = FakeFetch()
+    original_send = requests.Session.send
+
+    def send(self, request, **kwargs):
+        if "hltv.org" not in (request.url or ""):
+            return original_send(self, request, **kwargs)
+        time.sleep(latency_ms / 1000)
+        resp = requests.Response()
+        resp.url = request.url
+        resp.request = request
+        resp.encoding = "utf-8"
+        resp.headers["Content-Type"] = "text/html; charset=utf-8"
+        try:
+            resp._content = fake(request.url).encode("utf-8")
+            resp.status_code = 200
+        except LookupError:
+            resp._content = b"not found"
+            resp.status_code = 404
+        return resp
+
+    requests.Session.send = send
+    return fake
+
+
+# ───────────────────────────── RELATÓRIO ────────────────────────────── #
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Percentil por rank mais próximo (0 se vazio)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, round(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def stage_breakdown(traces: List[List[Dict]]) -> List[Dict]:
+    """Agrega spans por nome: chamadas, total / self por requisição, p95."""
+    totals: Dict[str, List[float]] = defaultdict(list)
+    selfs: Dict[str, float] = defaultdict(float)
+    root_total = 0.0
+    for spans in traces:
+        children: Dict[Optional[str], float] = defaultdict(float)
+        for s in spans:
+            children[s["parent_id"]] += s["duration_ms"]
+        for s in spans:
+            totals[s["name"]].append(s["duration_ms"])
+            selfs[s["name"]] += max(0.0, s["duration_ms"] - children[s["context"]["span_id"]])
+            if s["parent_id"] is None:
+                root_total += s["duration_ms"]
+    n = max(1, len(traces))
+    rows = [{
+        "stage": name,
+        "calls": len(durations),
+        "total_ms_per_req": round(sum(durations) / n, 2),
+        "self_ms_per_req": round(selfs[name] / n, 2),
+        "self_share": round(selfs[name] / root_total, 4) if root_total else 0.0,
+        "p95_ms": round(percentile(durations, 95), 2),
+    } for name, durations in totals.items()]
+    return sorted(rows, key=lambda r: r["self_ms_per_req"], reverse=True)
+
+
+def print_report(report: Dict) -> None:
+    lat = report["latency_ms"]
+    print(f"\nusuários: {report['users']}  perguntas: {report['requests']}  "
+          f"erros: {report['errors']}  parede: {report['wall_s']:.2f} s")
+    print(f"vazão: {report['throughput_rps']:.2f} req/s   "
+          f"LLM: {report['llm_requests']} chamadas ({report['llm_rps']:.2f}/s)")
+    print(f"latência (ms): p50 {lat['p50']:.0f}  p95 {lat['p95']:.0f}  "
+          f"p99 {lat['p99']:.0f}  máx {lat['max']:.0f}  média {lat['mean']:.0f}")
+    print(f"\n{'estágio':<28}{'chamadas':>9}{'total/req':>12}{'self/req':>11}{'self %':>8}{'p95':>10}")
+    for row in report["stages"]:
+        print(f"{row['stage']:<28}{row['calls']:>9}{row['total_ms_per_req']:>12.1f}"
+              f"{row['self_ms_per_req']:>11.1f}{row['self_share'] * 100:>7.1f}%{row['p95_ms']:>10.1f}")
+    for message in report["error_samples"]:
+        print(f"erro: {message}")
+
+
+# ────────────────────────────── CARGA ───────────────────────────────── #
+
+def run_load(args: argparse.Namespace) -> Dict:
+    server = start_server(FakeLLMConfig(args.latency_ms, args.tokens_per_s, args.tool_rounds))
+    os.environ["OPENAI_API_BASE"] = os.environ["OPENAI_BASE_URL"] = server.base_url
+    os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+    os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+    install_offline_hltv(args.hltv_latency_ms)
+
+    from agents.hltv_agents import run_pantera_task
+    from furiachat.utils import tracing
+
+    tracing.configure(args.trace_file or None)
+    tracing.MAX_TRACES = max(tracing.MAX_TRACES, args.users * args.questions + args.warmup)
+
+    for i in range(args.warmup):  # imports, snapshot e caches fora da medição
+        run_pantera_task(QUESTIONS[i % len(QUESTIONS)], "sk-fake", model=args.model)
+
+    def user(index: int) -> List[Dict]:
+        results = []
+        for j in range(args.questions):
+            question = QUESTIONS[(index + j) % len(QUESTIONS)]
+            start = time.perf_counter()
+            try:
+                answer = run_pantera_task(question, "sk-fake", model=args.model)
+                results.append({"latency_ms": (time.perf_counter() - start) * 1000,
+                                "trace_id": answer["trace_id"]})
+            except Exception as exc:  # noqa: BLE001 – a carga continua
+                results.append({"latency_ms": (time.perf_counter() - start) * 1000,
+                                "error": f"{type(exc).__name__}: {exc}"})
+        return results
+
+    llm_before = server.requests
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.users) as pool:
+        results = [r for batch in pool.map(user, range(args.users)) for r in batch]
+    wall = time.perf_counter() - started
+    llm_requests = server.requests - llm_before
+    server.shutdown()
+    tracing.flush()
+
+    ok = [r for r in results if "error" not in r]
+    latencies = [r["latency_ms"] for r in ok]
+    traces = [tracing.get_trace(r["trace_id"]) for r in ok]
+    return {
+        "users": args.users,
+        "requests": len(results),
+        "errors": len(results) - len(ok),
+        "error_samples": sorted({r["error"] for r in results if "error" in r})[:5],
+        "wall_s": round(wall, 3),
+        "throughput_rps": round(len(ok) / wall, 3) if wall else 0.0,
+        "llm_requests": llm_requests,
+        "llm_rps": round(llm_requests / wall, 3) if wall else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50), 1),
+            "p95": round(percentile(latencies, 95), 1),
+            "p99": round(percentile(latencies, 99), 1),
+            "max": round(max(latencies, default=0.0), 1),
+            "mean": round(sum(latencies) / len(latencies), 1) if latencies else 0.0,
+        },
+        "stages": stage_breakdown([t for t in traces if t]),
+        "config": {k: v for k, v in vars(args).items() if k not in ("json",)},
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Teste de carga offline do Pantera‑Bot")
+    parser.add_argument("-u", "--users", type=int, default=50, help="usuários simultâneos")
+    parser.add_argument("-q", "--questions", type=int, default=4, help="perguntas por usuário")
+    parser.add_argument("--latency-ms", type=float, default=FakeLLMConfig.latency_ms,
+                        help="latência do LLM até o primeiro token")
+    parser.add_argument("--tokens-per-s", type=float, default=FakeLLMConfig.tokens_per_s,
+                        help="vazão de geração do LLM")
+    parser.add_argument("--tool-rounds", type=int, default=FakeLLMConfig.tool_rounds,
+                        help="chamadas de ferramenta por pergunta")
+    parser.add_argument("--hltv-latency-ms", type=float, default=150.0,
+                        help="latência simulada de cada GET na HLTV")
+    parser.add_argument("-m", "--model", default=None, help="fixa o modelo (padrão: roteador)")
+    parser.add_argument("--warmup", type=int, default=1, help="perguntas de aquecimento")
+    parser.add_argument("--trace-file", default="", help="exporta os spans em JSONL")
+    parser.add_argument("--json", help="grava o relatório em JSON")
+    parser.add_argument("--max-p95-ms", type=float, help="falha se p95 passar deste valor")
+    parser.add_argument("--min-throughput", type=float, help="falha se req/s ficar abaixo")
+    args = parser.parse_args(argv)
+
+    report = run_load(args)
+    print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2, ensure_ascii=False)
+
+    failed = report["errors"] > 0
+    if args.max_p95_ms is not None and report["latency_ms"]["p95"] > args.max_p95_ms:
+        print(f"FALHA: p95 {report['latency_ms']['p95']} ms > {args.max_p95_ms} ms")
+        failed = True
+    if args.min_throughput is not None and report["throughput_rps"] < args.min_throughput:
+        print(f"FALHA: vazão {report['throughput_rps']} req/s < {args.min_throughput} req/s")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
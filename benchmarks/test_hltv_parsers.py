@@ -0,0 +1,90 @@
+# benchmarks/test_hltv_parsers.py
+"""
+Benchmarks offline de cada `parse_*` e de `discover_links` sobre o corpus
+gravado: tempo por página (pytest-benchmark) + pico de memória e blocos
+retidos (tracemalloc) comparados com `baselines/memory.json`.
+
+Só a memória é guarda de regressão (independe da máquina).  O tempo é
+informativo: não há baseline de tempo versionado, porque varia com o
+hardware do CI.  Para comparar duas versões na mesma máquina:
+
+    pytest benchmarks --benchmark-autosave
+    pytest benchmarks --benchmark-compare --benchmark-compare-fail=median:15%
+"""
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pytest.importorskip("bs4")
+pytest.importorskip("lxml")
+
+from furiachat.src.furiachat.tools import hltv  # noqa: E402
+from hltv_fixtures import (  # noqa: E402
+    LISTING_NEWS,
+    LISTING_RESULTS,
+    LISTING_URL,
+    MATCH_URL,
+    NEWS_URL,
+    STATS_URL,
+    TEAM_URL,
+    load_page,
+)
+
+
+def _check_team(out):
+    assert len(out["roster"]) == 5 and out["next_matches"] and out["recent_results"]
+
+
+def _check_listing(out):
+    assert len(out["recent_results"]) == LISTING_RESULTS
+
+
+def _check_stats(out):
+    assert out["rating"] and len(out["top_maps"]) == 7
+
+
+def _check_match(out):
+    assert out["teams"] == ["FURIA", "MOUZ"] and out["score"] == [2, 1] and out["veto"]
+
+
+def _check_news(out):
+    assert out["title"] and out["author"] and out["datetime_utc"] and out["body_md"]
+
+
+def _check_links(out):
+    assert out and all(link.startswith(hltv.HLTV_BASE) for link in out)
+
+
+def _check_listing_links(out):
+    assert len(out) == LISTING_RESULTS + LISTING_NEWS
+
+
+# caso → (função, kwargs, verificação do resultado)
+CASES = {
+    "parse_team_overview": ("parse_team_overview", lambda: {"url": TEAM_URL}, _check_team),
+    "parse_team_overview[listing]": ("parse_team_overview", lambda: {"url": LISTING_URL}, _check_listing),
+    "parse_stats_team": ("parse_stats_team", lambda: {"url": STATS_URL}, _check_stats),
+    "parse_match_summary": ("parse_match_summary", lambda: {"url": MATCH_URL}, _check_match),
+    "parse_news": ("parse_news", lambda: {"url": NEWS_URL}, _check_news),
+    "discover_links[url]": ("discover_links", lambda: {"url": TEAM_URL}, _check_links),
+    "discover_links[listing-html]": ("discover_links", lambda: {"html": load_page(LISTING_URL)},
+                                     _check_listing_links),
+}
+
+
+@pytest.mark.benchmark(group="hltv-parsers")
+@pytest.mark.parametrize("case", list(CASES))
+def test_parser(case, benchmark, fake_fetch, memory_baseline):
+    name, make_kwargs, check = CASES[case]
+    func = getattr(hltv, name)
+    kwargs = make_kwargs()
+
+    def call():
+        return func(**kwargs)
+
+    check(call())
+    memory = memory_baseline.measure(case, call)
+    benchmark.extra_info.update(memory)
+    benchmark.extra_info["page_bytes"] = len(kwargs.get("html") or load_page(kwargs["url"]))
+    benchmark(call)
@@ -0,0 +1,27 @@
+# benchmarks/test_importtime.py
+"""
+Cold start da UI: os imports de topo do `app.py` não podem puxar CrewAI,
+pandas & cia (ver `importtime.HEAVY`), e o tempo de import fica registrado
+no pytest-benchmark (`--benchmark-autosave` / `--benchmark-compare`).
+"""
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pytest.importorskip("streamlit")
+
+from importtime import HEAVY, app_imports, loaded_modules, profile, summarize  # noqa: E402
+
+
+def test_app_imports_skip_heavy_dependencies():
+    heavy = loaded_modules(app_imports()) & set(HEAVY)
+    assert not heavy, f"app.py carrega dependências pesadas no cold start: {sorted(heavy)}"
+
+
+@pytest.mark.benchmark(group="cold-start")
+def test_app_import_time(benchmark):
+    modules = app_imports()
+    records = benchmark.pedantic(profile, args=(modules,), rounds=3, iterations=1)
+    summary = summarize(records, top=5)
+    benchmark.extra_info.update(total_ms=summary["total_ms"], top=summary["top"])
@@ -1,71 +1,286 @@
 """
 LeadProfileFlow ― orquestra todo o pipeline em passos declarativos.
+
+Os leads chegam em streaming (arquivo JSONL/CSV, `queue.Queue` ou qualquer
+iterável).  O índice local de DDD (`tools/ddd_index.py`) resolve a maioria
+sem LLM; o restante vai para o crew com até `concurrency` kickoffs
+assíncronos simultâneos.  Os resultados são enriquecidos por coluna, em
+lotes, e acrescentados a um dataset Parquet particionado por data
+(`utils/columnar.py`); os telefones gravados vão para o arquivo de
+checkpoint, então uma execução interrompida retoma sem refazer os leads já
+concluídos.
+
+Exemplo:
+    LeadProfileFlow().kickoff(inputs={
+        "source": "leads.jsonl",
+        "dataset_path": "leads_result",     # dataset Parquet (Hive)
+        "concurrency": 16,
+        "model": "gpt-4o-mini",            # opcional: preço se o crew não informar
+        "report_path": "auditoria.xlsx",   # opcional
+    })
 """
+import asyncio
+import csv
+import json
+import os
+import queue
 from crewai import Flow
 from crewai.flow.flow import start, listen
-from typing import List, Dict
-from furiachat.crew import Leadprofile
-from furiachat.src.leadprofile.crew import Leadprofile
-from furiachat.utils.cost import gpt4o_mini_cost
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from furiachat.src.furiachat.crew import Leadprofile
+from furiachat.src.furiachat.tools.ddd_index import resolve_many
+from furiachat.utils.columnar import ResultStore, enrich_batch
 from furiachat.utils.usage import usage_to_dict
 
+DEFAULT_MODEL = "gpt-4o-mini"
+
+DEMO_LEADS: List[Dict] = [
+    {"name": "Maria Silva", "phone": "31988775544"},
+    {"name": "Carlos Souza", "phone": "67987654321"},
+]
+
+# ─────────────────────────────── SOURCES ───────────────────────────────────
+
+
+def _parse_lead(raw: Any, lineno: int) -> Dict:
+    """
+    {name, phone} de uma linha da fonte (texto JSONL ou dict do CSV).
+    Linha inválida ou sem `phone` vira `{"line", "error"}`.
+    """
+    try:
+        if isinstance(raw, str):
+            raw = json.loads(raw)
+        if not raw["phone"]:
+            raise KeyError("phone")
+        return {"name": raw["name"], "phone": raw["phone"]}
+    except (json.JSONDecodeError, KeyError, TypeError) as exc:
+        return {"line": lineno, "error": f"linha {lineno}: {type(exc).__name__}: {exc}"}
+
+
+def iter_leads(source: Any) -> Iterator[Dict]:
+    """
+    Itera leads {name, phone} sem carregar a fonte inteira em memória.
+
+    `source` pode ser caminho .jsonl/.csv, `queue.Queue` (termina ao receber
+    `None`) ou qualquer iterável de dicts.  Linhas ruins do arquivo saem como
+    registros de erro (ver `_parse_lead`) sem interromper a leitura.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        with open(path, encoding="utf-8", newline="") as fh:
+            if path.endswith(".csv"):
+                reader = csv.DictReader(fh)
+                for row in reader:
+                    yield _parse_lead(row, reader.line_num)
+            else:
+                for lineno, line in enumerate(fh, start=1):
+                    if line.strip():
+                        yield _parse_lead(line, lineno)
+    elif isinstance(source, queue.Queue):
+        while (lead := source.get()) is not None:
+            yield lead
+    else:
+        yield from source
+
+
+def _crew_model(crew) -> Optional[str]:
+    """Nome do modelo do LLM do primeiro agente do crew (se houver)."""
+    llm = crew.agents[0].llm if crew.agents else None
+    return getattr(llm, "model", None) or (llm if isinstance(llm, str) else None)
+
+
+class Checkpoint:
+    """Arquivo append‑only com os telefones dos leads já concluídos."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.done: Set[str] = set()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as fh:
+                self.done = {line.strip() for line in fh if line.strip()}
+        self._fh = open(path, "a", encoding="utf-8")
+
+    def __contains__(self, phone: str) -> bool:
+        return phone in self.done
+
+    def add(self, phone: str) -> None:
+        self.done.add(phone)
+        self._fh.write(phone + "\n")
+        self._fh.flush()
+
+    def close(self) -> None:
+        self._fh.close()
+
 # ─────────────────────────────── FLOW ──────────────────────────────────────
 
 
 class LeadProfileFlow(Flow):
 
+    def __init__(self, lead_source: Optional[Iterable[Dict]] = None, **kwargs: Any):
+        # fontes que não cabem no state (filas, geradores) vêm por aqui
+        self._lead_source = lead_source
+        super().__init__(**kwargs)
+
     # 1) INPUT -----------------------------------------------------------------
     @start()
-    def receive_leads(self) -> List[Dict]:
+    def receive_leads(self) -> Iterator[Dict]:
         """
-        Recebe (ou simula) leads em formato [{name, phone}].
-        Em produção, você pode trocar por leitura de fila/DB/HTTP.
+        Devolve um iterador preguiçoso de leads em formato {name, phone}.
+        Fonte: `lead_source` do construtor, `state["source"]` (arquivo) ou
+        a lista de demonstração.
         """
-        return [
-            {"name": "Maria Silva", "phone": "31988775544"},
-            {"name": "Carlos Souza", "phone": "67987654321"},
-        ]
+        source = self._lead_source or self.state.get("source") or DEMO_LEADS
+        return iter_leads(source)
 
     # 2) RUN CREW FOR EACH LEAD ------------------------------------------------
     @listen(receive_leads)
-    def identify_location(self, leads: List[Dict]):
+    async def identify_location(self, leads: Iterator[Dict]) -> Dict[str, int]:
+        """
+        Resolve a localidade de cada lead, lendo a fonte em lotes de
+        `batch_size`.  Cada lote passa primeiro pelo índice local de DDD
+        (vetorizado); só os telefones não reconhecidos vão para o Leadprofile
+        crew, com concorrência limitada.  Os resultados entram num buffer que
+        é enriquecido e gravado (colunar) a cada `batch_size` leads; só então
+        os telefones vão para o checkpoint.  Telefone repetido na fonte (no
+        mesmo lote ou ainda em processamento) é contado em `skipped` e não é
+        resolvido de novo; linha inválida ou sem `phone` vai para
+        `errors_path` e conta em `failed`.  Retorna só contadores.
+        """
+        dataset_path = self.state.setdefault("dataset_path", "leadprofile_results")
+        checkpoint = Checkpoint(self.state.setdefault(
+            "checkpoint_path", dataset_path + ".ckpt"))
+        store = ResultStore(dataset_path)
+        batch_size = int(self.state.get("batch_size", 1000))
+        slots = asyncio.Semaphore(int(self.state.get("concurrency", 8)))
+        crews: List = []  # crew só é montado se algum lead precisar dele
+        # modelo usado no preço: o do LLM do crew, quando ele é montado
+        model = self.state.get("model") or DEFAULT_MODEL
+        stats = {"processed": 0, "resolved_locally": 0, "skipped": 0, "failed": 0}
+        pending: Set[asyncio.Task] = set()
+        buffer: List[Tuple[Dict, Dict, Optional[Dict]]] = []
+        seen: Set[str] = set()  # telefones desta execução (buffer, em voo ou gravados)
+
+        def fail(leads: List[Dict], exc: Exception) -> None:
+            # não entram no checkpoint: a próxima execução tenta de novo
+            stats["failed"] += len(leads)
+            for lead in leads:
+                err_fh.write(json.dumps(
+                    {**lead, "error": f"{type(exc).__name__}: {exc}"}, ensure_ascii=False) + "\n")
+            err_fh.flush()
+
+        async def flush() -> None:
+            if not buffer:
+                return
+            rows = buffer[:]
+            buffer.clear()
+            try:
+                # pyarrow + escrita em disco fora do event loop: os kickoffs seguem
+                await asyncio.to_thread(
+                    lambda: self.store_results(store, self.enrich_results(rows, model)))
+            except Exception as exc:
+                # o lote inteiro falhou, não só o lead que disparou o flush
+                fail([lead for lead, _, _ in rows], exc)
+                return
+            for lead, _, _ in rows:
+                checkpoint.add(lead["phone"])
+            stats["processed"] += len(rows)
+
+        async def collect(lead: Dict, data: Dict, usage: Optional[Dict]) -> None:
+            buffer.append((lead, data, usage))
+            if len(buffer) >= batch_size:
+                await flush()
+
+        async def process(lead: Dict) -> None:
+            nonlocal model
+            try:
+                if not crews:
+                    crews.append(Leadprofile().crew())
+                    model = _crew_model(crews[0]) or model
+                out = await crews[0].copy().kickoff_async(
+                    inputs={"name": lead["name"], "phone": lead["phone"]})
+            except Exception as exc:
+                fail([lead], exc)
+                return
+            finally:
+                slots.release()
+            await collect(lead, out.to_dict(), usage_to_dict(out.token_usage))
+
+        errors_path = self.state.setdefault("errors_path", dataset_path + "_errors.jsonl")
+        with open(errors_path, "a", encoding="utf-8") as err_fh:
+            try:
+                while True:
+                    # fontes bloqueantes (fila/arquivo) não travam o event loop
+                    chunk = await asyncio.to_thread(lambda: list(islice(leads, batch_size)))
+                    if not chunk:
+                        break
+                    todo = []
+                    for lead in chunk:
+                        phone = lead.get("phone")
+                        if lead.get("error") or not phone:
+                            stats["failed"] += 1
+                            err_fh.write(json.dumps(
+                                {"error": "lead sem phone", **lead}, ensure_ascii=False) + "\n")
+                            continue
+                        if phone in checkpoint or phone in seen:
+                            stats["skipped"] += 1
+                            continue
+                        seen.add(phone)
+                        todo.append(lead)
+                    err_fh.flush()
+                    if not todo:
+                        continue
+                    located = resolve_many(lead["phone"] for lead in todo)
+                    for lead, row in zip(todo, located.itertuples(index=False)):
+                        if isinstance(row.ddd, str):
+                            await collect(lead, {"state": row.state, "cities": row.cities,
+                                                 "url": row.url}, None)
+                            stats["resolved_locally"] += 1
+                            continue
+                        await slots.acquire()
+                        task = asyncio.create_task(process(lead))
+                        pending.add(task)
+                        task.add_done_callback(pending.discard)
+                if pending:
+                    await asyncio.wait(set(pending))
+                await flush()
+            finally:
+                checkpoint.close()
+
+        self.state.update(stats)
+        return stats
+
+    # 3) POST‑PROCESS: custo + DDD por coluna (lote) ---------------------------
+    def enrich_results(self, rows: List[Tuple[Dict, Dict, Optional[Dict]]],
+                       model: str = DEFAULT_MODEL):
         """
-        Executa o Leadprofile crew para cada lead.
-        Retorna lista de objetos CrewOutput.
+        `rows` = [(lead, {state, cities, url}, usage | None)]; `usage` é
+        `None` quando o lead foi resolvido pelo índice local (custo zero).
+        `model` é o LLM do crew, para o preço por token.
+        Devolve `pyarrow.Table` (ver `utils/columnar.py`).
         """
-        crew = Leadprofile().crew()
-        results = crew.kickoff_for_each(inputs_list=[
-            {"name": lead["name"], "phone": lead["phone"]}
-            for lead in leads
-        ])
-        return results
-
-    # 3) POST‑PROCESS: custo + estrutura dict ----------------------------------
+        return enrich_batch(rows, run_id=str(self.state.get("id", "")), model=model)
+
+    # 4) ARMAZENAR (dataset Parquet particionado) -----------------------------
+    def store_results(self, store: ResultStore, table) -> None:
+        """
+        Acrescenta o lote ao dataset; troque por banco se quiser.
+        """
+        store.append(table)
+
     @listen(identify_location)
-    def enrich_results(self, crew_outputs):
-        enriched = []
-        for out in crew_outputs:
-            data = out.to_dict()            # state, cities, url
-            tok_dict = usage_to_dict(out.token_usage)
-            usd_cost = gpt4o_mini_cost(tok_dict)
-
-            enriched.append({
-                "name":        out.inputs["name"],
-                "phone":       out.inputs["phone"],
-                "ddd":         data["url"].split("ddd-")[1],
-                "state":       data["state"],
-                "cities":      data["cities"],
-                "url":         data["url"],
-                "usd_cost":    usd_cost,
-                "total_tokens": tok_dict["total_tokens"]
-            })
-        self.state["results"] = enriched
-        return enriched
-
-    # 4) ARMAZENAR (exemplo simples) ------------------------------------------
-    @listen(enrich_results)
-    def store(self, enriched):
+    def store(self, stats: Dict[str, int]) -> Dict[str, int]:
         """
-        Aqui você salvava no banco; por enquanto só devolve.
+        Fim do fluxo: os registros já estão em `dataset_path`.  Se
+        `state["report_path"]` existir (.xlsx/.csv/.parquet), gera o
+        relatório de auditoria em streaming a partir dele.
         """
-        return enriched
+        dataset_path = self.state["dataset_path"]
+        summary = {**stats, "dataset_path": dataset_path}
+        report_path = self.state.get("report_path")
+        if report_path:
+            from furiachat.utils.excel_report import write_audit_report
+            summary["report_rows"] = write_audit_report(
+                ResultStore(dataset_path).iter_rows(), report_path)
+            summary["report_path"] = report_path
+        return summary
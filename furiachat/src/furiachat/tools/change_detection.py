@@ -0,0 +1,156 @@
+# furiachat/tools/change_detection.py
+"""
+Detecção de mudanças nas páginas HLTV raspadas.
+
+Cada seção devolvida por `parse_team_overview`, `parse_stats_team` e
+`parse_match_summary` ganha uma impressão digital (hash do JSON canônico).
+Na primeira vez que uma URL é vista a impressão só é guardada; nas
+seguintes, seções com hash diferente viram um diff estruturado (jogador
+entrou, jogo remarcado, resultado novo…) publicado no barramento
+`furiachat.utils.events.bus` com tópico `<página>.<seção>`:
+
+    team.roster          player_added / player_removed / player_updated
+    team.next_matches    match_scheduled / match_removed / match_rescheduled / match_updated
+    team.recent_results  result_added / result_removed / result_updated
+    stats.summary        stats_changed
+    stats.top_maps       map_added / map_removed / map_updated
+    match.score | match.veto | match.mvp    score_changed / veto_changed / mvp_changed
+
+Payload: {url, section, old_fingerprint, new_fingerprint, changes: [...]}.
+Assinantes invalidam só o que depende da seção (HTML de partidas, snapshot…)
+em vez de encurtar o TTL de tudo.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from furiachat.utils.events import EventBus, bus as default_bus
+
+__all__ = ["SECTIONS", "fingerprint", "diff_section", "ChangeDetector", "detector"]
+
+# página → seção → extrai o valor da seção do dict parseado
+SECTIONS = {
+    "team": {
+        "roster": lambda d: d["roster"],
+        "next_matches": lambda d: d["next_matches"],
+        "recent_results": lambda d: d["recent_results"],
+    },
+    "stats": {
+        "summary": lambda d: {k: d[k] for k in ("rating", "kd", "maps_played")},
+        "top_maps": lambda d: d["top_maps"],
+    },
+    "match": {
+        "score": lambda d: {"teams": d["teams"], "score": d["score"]},
+        "veto": lambda d: d["veto"],
+        "mvp": lambda d: d["mvp"],
+    },
+}
+
+# seções em lista: (chave do item, adicionado, removido, alterado)
+_KEYED = {
+    ("team", "roster"): ("nickname", "player_added", "player_removed", "player_updated"),
+    ("team", "next_matches"): ("url", "match_scheduled", "match_removed", "match_updated"),
+    ("team", "recent_results"): ("url", "result_added", "result_removed", "result_updated"),
+    ("stats", "top_maps"): ("map", "map_added", "map_removed", "map_updated"),
+}
+
+_SCALAR = {
+    ("stats", "summary"): "stats_changed",
+    ("match", "score"): "score_changed",
+    ("match", "veto"): "veto_changed",
+    ("match", "mvp"): "mvp_changed",
+}
+
+
+def _canonical(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, default=str, separators=(",", ":"))
+
+
+def fingerprint(value: Any) -> str:
+    """Hash estável do valor (datetimes e afins via `str`)."""
+    return hashlib.sha1(_canonical(value).encode("utf-8")).hexdigest()[:16]
+
+
+def _plain(value: Any) -> Any:
+    return json.loads(_canonical(value))
+
+
+def diff_section(page: str, section: str, old: Any, new: Any) -> List[Dict]:
+    """Diff estruturado entre duas versões de uma seção."""
+    keyed = _KEYED.get((page, section))
+    if keyed is None:
+        kind = _SCALAR.get((page, section), f"{section}_changed")
+        return [{"type": kind, "from": _plain(old), "to": _plain(new)}]
+
+    key, added, removed, updated = keyed
+    before = {item.get(key): item for item in old}
+    after = {item.get(key): item for item in new}
+    changes: List[Dict] = []
+    for k, item in after.items():
+        if k not in before:
+            changes.append({"type": added, key: k, "item": _plain(item)})
+            continue
+        fields = {f: [_plain(before[k].get(f)), _plain(v)]
+                  for f, v in item.items() if _canonical(before[k].get(f)) != _canonical(v)}
+        if not fields:
+            continue
+        kind = updated
+        if section == "next_matches" and "datetime_utc" in fields:
+            kind = "match_rescheduled"
+        changes.append({"type": kind, key: k, "fields": fields})
+    for k, item in before.items():
+        if k not in after:
+            changes.append({"type": removed, key: k, "item": _plain(item)})
+    return changes
+
+
+class ChangeDetector:
+    """Guarda a última impressão de cada seção por URL e publica os diffs."""
+
+    def __init__(self, event_bus: EventBus = default_bus, max_urls: int = 256):
+        self.bus = event_bus
+        self.max_urls = max_urls
+        self._lock = threading.Lock()
+        self._seen: "OrderedDict[str, Dict[str, Tuple[str, Any]]]" = OrderedDict()
+
+    def observe(self, page: str, url: str, parsed: Dict) -> List[Dict]:
+        """Compara `parsed` com a última versão de `url`; publica e devolve os eventos."""
+        sections = {name: get(parsed) for name, get in SECTIONS[page].items()}
+        current = {name: (fingerprint(value), value) for name, value in sections.items()}
+        with self._lock:
+            previous: Optional[Dict] = self._seen.pop(url, None)
+            self._seen[url] = current
+            while len(self._seen) > self.max_urls:
+                self._seen.popitem(last=False)
+        if previous is None:
+            return []
+
+        published = []
+        for name, (fp, value) in current.items():
+            old_fp, old_value = previous[name]
+            if fp == old_fp:
+                continue
+            changes = diff_section(page, name, old_value, value)
+            if not changes:
+                continue
+            payload = {"url": url, "section": name, "old_fingerprint": old_fp,
+                       "new_fingerprint": fp, "changes": changes}
+            self.bus.publish(f"{page}.{name}", payload)
+            published.append(payload)
+        return published
+
+    def forget(self, url: Optional[str] = None) -> None:
+        """Esquece uma URL (ou todas): a próxima observação vira baseline."""
+        with self._lock:
+            if url is None:
+                self._seen.clear()
+            else:
+                self._seen.pop(url, None)
+
+
+# detector padrão, ligado ao barramento do processo
+detector = ChangeDetector()
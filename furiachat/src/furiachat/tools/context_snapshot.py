@@ -0,0 +1,253 @@
+# furiachat/tools/context_snapshot.py
+"""
+Snapshot compacto de contexto da FURIA para injetar no prompt do agente.
+
+Com `max_iter=4`, o agente gastava a maior parte das chamadas ao LLM só
+decidindo qual URL da HLTV raspar.  Este módulo pré‑computa, a cada refresh,
+um resumo pequeno e versionado das saídas de `parse_team_overview` e
+`parse_stats_team` (roster, próximos jogos, resultados recentes e mapas mais
+jogados).  O texto é injetado na `Task`; o agente só chama `hltv_scraper`
+para consultas mais profundas (partidas, notícias…).
+
+Funções exportadas:
+• `build_context_snapshot()` – raspa e compacta (sem cache)
+• `get_context_snapshot(max_age=...)` – snapshot em memória; se só venceu
+  por idade, devolve o atual e refaz em segundo plano
+• `warm_context_snapshot()` – dispara o refresh em segundo plano (startup)
+• `peek_context_snapshot()` – snapshot em memória, sem refazer (pode ser None)
+• `refresh_context_snapshot()` – força novo snapshot
+• `invalidate_context_snapshot()` – descarta o snapshot atual
+• `snapshot_to_prompt(snapshot)` – texto compacto para o prompt
+
+Cada refresh baixa de novo a página do time (sonda barata de mudanças); o
+resto do HTML segue em cache até um evento de `change_detection` dizer que
+mudou.  Eventos `team.*` / `stats.*` vindos de fora de um refresh vencem o
+snapshot na hora – sem encurtar o `SNAPSHOT_MAX_AGE`.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from furiachat.utils.events import Event, bus
+from furiachat.utils.tracing import traced
+
+from .hltv import TEAM_URL, invalidate_html, parse_stats_team, parse_team_overview
+
+__all__ = [
+    "SNAPSHOT_VERSION",
+    "SNAPSHOT_MAX_AGE",
+    "build_context_snapshot",
+    "get_context_snapshot",
+    "peek_context_snapshot",
+    "refresh_context_snapshot",
+    "warm_context_snapshot",
+    "invalidate_context_snapshot",
+    "snapshot_to_prompt",
+]
+
+# Incrementar sempre que o formato do snapshot mudar.
+SNAPSHOT_VERSION = 1
+SNAPSHOT_MAX_AGE = 15 * 60  # segundos
+
+MAX_NEXT_MATCHES = 3
+MAX_RECENT_RESULTS = 5
+MAX_TOP_MAPS = 5
+
+# back‑off após refresh com erro (HLTV fora do ar): 30 s, 60 s… até 10 min
+RETRY_MIN = 30
+RETRY_MAX = 10 * 60
+
+log = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_refresh_lock = threading.Lock()  # só uma thread raspa por vez
+_snapshot: Optional[Dict] = None
+_building = threading.local()  # eventos disparados pelo próprio refresh
+_failures = 0
+_retry_at = 0.0  # antes disso nenhuma pergunta tenta raspar de novo
+
+
+# ─────────────────────────── BUILD ───────────────────────────────────── #
+
+def _iso(value) -> str | None:
+    if isinstance(value, datetime):
+        return value.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+    return value
+
+
+@traced("snapshot.build")
+def build_context_snapshot(probe: bool = True) -> Dict:
+    """Raspa overview + stats e devolve dicionário compacto e versionado.
+
+    Com `probe`, a página do time é baixada de novo (não vem do cache) para
+    o detector de mudanças comparar com a versão anterior.
+    """
+    if probe:
+        invalidate_html(TEAM_URL)
+    _building.active = True
+    try:
+        overview = parse_team_overview()
+        stats = parse_stats_team()
+    finally:
+        _building.active = False
+
+    return {
+        "version": SNAPSHOT_VERSION,
+        "generated_at": time.time(),
+        "roster": [p["nickname"] for p in overview["roster"]],
+        "next_matches": [
+            {"opponent": m["opponent"], "event": m["event"],
+             "datetime_utc": _iso(m["datetime_utc"]), "url": m["url"]}
+            for m in overview["next_matches"][:MAX_NEXT_MATCHES]
+        ],
+        "recent_results": [
+            {"opponent": r["opponent"], "score": r["score"],
+             "event": r["event"], "url": r["url"]}
+            for r in overview["recent_results"][:MAX_RECENT_RESULTS]
+        ],
+        "stats": {
+            "rating": stats["rating"],
+            "kd": stats["kd"],
+            "maps_played": stats["maps_played"],
+            "top_maps": [
+                {"map": m["map"], "times_played": m["times_played"],
+                 "win_pct": m["win_pct"]}
+                for m in stats["top_maps"][:MAX_TOP_MAPS]
+            ],
+        },
+        "sources": [overview["source"], stats["source"]],
+    }
+
+
+# ─────────────────────────── CACHE ───────────────────────────────────── #
+
+def refresh_context_snapshot() -> Dict:
+    """Força um novo snapshot e o guarda em memória."""
+    global _snapshot
+    snapshot = build_context_snapshot()
+    with _lock:
+        _snapshot = snapshot
+    return snapshot
+
+
+def invalidate_context_snapshot() -> None:
+    """Descarta o snapshot atual (e o back‑off); o próximo `get_context_snapshot` refaz."""
+    global _snapshot, _failures, _retry_at
+    with _lock:
+        _snapshot = None
+        _failures, _retry_at = 0, 0.0
+
+
+def _on_change(event: Event) -> None:
+    """Time ou stats mudaram: vence o snapshot (mantido como fallback)."""
+    global _snapshot
+    if getattr(_building, "active", False):
+        return  # o refresh em curso já vai gravar a versão nova
+    with _lock:
+        if _snapshot is not None:
+            _snapshot = {**_snapshot, "stale": True}
+
+
+bus.subscribe("team.", _on_change)
+bus.subscribe("stats.", _on_change)
+
+
+def peek_context_snapshot() -> Optional[Dict]:
+    """Snapshot atual em memória, sem raspar nada."""
+    with _lock:
+        return _snapshot
+
+
+def _try_refresh() -> Optional[Dict]:
+    """Refresh respeitando o back‑off; chamar com `_refresh_lock` em mãos."""
+    global _failures, _retry_at
+    if time.time() < _retry_at:
+        return None
+    try:
+        snapshot = refresh_context_snapshot()
+    except Exception as exc:
+        _failures += 1
+        delay = min(RETRY_MIN * 2 ** (_failures - 1), RETRY_MAX)
+        _retry_at = time.time() + delay
+        log.warning("snapshot da FURIA falhou (%s); nova tentativa em %ds", exc, delay)
+        return None
+    _failures, _retry_at = 0, 0.0
+    return snapshot
+
+
+def _refresh_in_background() -> None:
+    if not _refresh_lock.acquire(blocking=False):
+        return  # já tem alguém raspando
+
+    def run() -> None:
+        try:
+            _try_refresh()
+        finally:
+            _refresh_lock.release()
+
+    threading.Thread(target=run, name="snapshot-refresh", daemon=True).start()
+
+
+def warm_context_snapshot() -> None:
+    """Pré‑computa o snapshot em segundo plano (ex.: no startup do app)."""
+    _refresh_in_background()
+
+
+def get_context_snapshot(max_age: float = SNAPSHOT_MAX_AGE) -> Optional[Dict]:
+    """Devolve o snapshot em memória, refazendo se vencido.
+
+    Vencido só por idade: devolve o atual e refaz em segundo plano, fora do
+    caminho da pergunta.  Sem snapshot, ou com um marcado `stale` pelo
+    detector de mudanças, raspa na hora – a menos que um refresh recente
+    tenha falhado; aí espera o back‑off e devolve o que houver.
+
+    Retorna `None` se a HLTV estiver inacessível e não houver snapshot
+    anterior – o agente segue só com a ferramenta nesse caso.
+    """
+    def current() -> Optional[Dict]:
+        with _lock:
+            snapshot = _snapshot
+        if snapshot is None or snapshot["version"] != SNAPSHOT_VERSION:
+            return None
+        return snapshot
+
+    def fresh() -> Optional[Dict]:
+        snapshot = current()
+        if (
+            snapshot is not None
+            and not snapshot.get("stale")
+            and time.time() - snapshot["generated_at"] < max_age
+        ):
+            return snapshot
+        return None
+
+    snapshot = fresh()
+    if snapshot is not None:
+        return snapshot
+    snapshot = current()
+    if snapshot is not None and not snapshot.get("stale"):
+        _refresh_in_background()
+        return snapshot
+    if time.time() < _retry_at:
+        return snapshot  # HLTV falhou há pouco: não tenta de novo por pergunta
+    with _refresh_lock:
+        # outra thread pode ter refeito enquanto esperávamos
+        return fresh() or _try_refresh() or current()
+
+
+# ─────────────────────────── PROMPT ──────────────────────────────────── #
+
+def snapshot_to_prompt(snapshot: Dict) -> str:
+    """Serializa o snapshot em texto curto (JSON compacto) para o prompt."""
+    generated = datetime.fromtimestamp(snapshot["generated_at"], tz=timezone.utc)
+    payload = {k: v for k, v in snapshot.items() if k not in ("generated_at", "stale")}
+    return (
+        f"Snapshot HLTV da FURIA (v{snapshot['version']}, gerado em "
+        f"{generated:%Y-%m-%d %H:%M} UTC):\n"
+        + json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    )
@@ -0,0 +1,171 @@
+# furiachat/tools/ddd_index.py
+"""
+Índice local DDD → estado / cidades / URL de referência.
+
+O mapeamento de DDD é estático (67 códigos de área no Brasil), então não
+precisa de LLM: este módulo resolve direto do telefone, em microssegundos e
+sem custo de tokens.  O crew `Leadprofile` fica só para números que o índice
+não reconhece (formato inválido ou DDD inexistente).
+
+Funções exportadas:
+• `extract_ddd(phone)` – DDD normalizado ou `None`
+• `resolve_location(phone)` – {state, cities, url} ou `None`
+• `resolve_many(phones)` – resolução vetorizada (pandas) para lotes
+"""
+from __future__ import annotations
+
+import re
+from typing import Dict, Iterable, Optional, Tuple
+
+__all__ = [
+    "DDD_INDEX",
+    "DDD_URL_TEMPLATE",
+    "PHONE_PATTERN",
+    "extract_ddd",
+    "resolve_location",
+    "resolve_many",
+]
+
+# Mesmo sufixo `ddd-<nn>` que o fluxo usa para extrair o DDD da URL.
+DDD_URL_TEMPLATE = "https://www.claro.com.br/blog/ddd-{ddd}"
+
+STATES = {
+    "AC": "Acre", "AL": "Alagoas", "AM": "Amazonas", "AP": "Amapá",
+    "BA": "Bahia", "CE": "Ceará", "DF": "Distrito Federal",
+    "ES": "Espírito Santo", "GO": "Goiás", "MA": "Maranhão",
+    "MG": "Minas Gerais", "MS": "Mato Grosso do Sul", "MT": "Mato Grosso",
+    "PA": "Pará", "PB": "Paraíba", "PE": "Pernambuco", "PI": "Piauí",
+    "PR": "Paraná", "RJ": "Rio de Janeiro", "RN": "Rio Grande do Norte",
+    "RO": "Rondônia", "RR": "Roraima", "RS": "Rio Grande do Sul",
+    "SC": "Santa Catarina", "SE": "Sergipe", "SP": "São Paulo",
+    "TO": "Tocantins",
+}
+
+# DDD → (UF, principais cidades)
+_RAW: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "11": ("SP", ("São Paulo", "Guarulhos", "Osasco", "Santo André", "São Bernardo do Campo")),
+    "12": ("SP", ("São José dos Campos", "Taubaté", "Jacareí")),
+    "13": ("SP", ("Santos", "São Vicente", "Guarujá", "Praia Grande")),
+    "14": ("SP", ("Bauru", "Marília", "Jaú", "Botucatu")),
+    "15": ("SP", ("Sorocaba", "Itapetininga", "Itu")),
+    "16": ("SP", ("Ribeirão Preto", "Franca", "São Carlos", "Araraquara")),
+    "17": ("SP", ("São José do Rio Preto", "Catanduva", "Barretos")),
+    "18": ("SP", ("Presidente Prudente", "Araçatuba", "Assis")),
+    "19": ("SP", ("Campinas", "Piracicaba", "Limeira", "Americana")),
+    "21": ("RJ", ("Rio de Janeiro", "Niterói", "São Gonçalo", "Duque de Caxias", "Nova Iguaçu")),
+    "22": ("RJ", ("Campos dos Goytacazes", "Macaé", "Cabo Frio", "Nova Friburgo")),
+    "24": ("RJ", ("Volta Redonda", "Petrópolis", "Barra Mansa", "Angra dos Reis")),
+    "27": ("ES", ("Vitória", "Vila Velha", "Serra", "Cariacica")),
+    "28": ("ES", ("Cachoeiro de Itapemirim", "Alegre")),
+    "31": ("MG", ("Belo Horizonte", "Contagem", "Betim", "Ipatinga")),
+    "32": ("MG", ("Juiz de Fora", "Barbacena", "São João del-Rei")),
+    "33": ("MG", ("Governador Valadares", "Teófilo Otoni", "Caratinga")),
+    "34": ("MG", ("Uberlândia", "Uberaba", "Araguari", "Patos de Minas")),
+    "35": ("MG", ("Poços de Caldas", "Pouso Alegre", "Varginha", "Lavras")),
+    "37": ("MG", ("Divinópolis", "Itaúna", "Formiga")),
+    "38": ("MG", ("Montes Claros", "Janaúba", "Unaí")),
+    "41": ("PR", ("Curitiba", "São José dos Pinhais", "Colombo", "Paranaguá")),
+    "42": ("PR", ("Ponta Grossa", "Guarapuava", "Irati")),
+    "43": ("PR", ("Londrina", "Apucarana", "Arapongas")),
+    "44": ("PR", ("Maringá", "Umuarama", "Campo Mourão")),
+    "45": ("PR", ("Cascavel", "Foz do Iguaçu", "Toledo")),
+    "46": ("PR", ("Francisco Beltrão", "Pato Branco")),
+    "47": ("SC", ("Joinville", "Blumenau", "Itajaí", "Balneário Camboriú")),
+    "48": ("SC", ("Florianópolis", "São José", "Criciúma", "Palhoça")),
+    "49": ("SC", ("Chapecó", "Lages", "Caçador")),
+    "51": ("RS", ("Porto Alegre", "Canoas", "Novo Hamburgo", "Gravataí")),
+    "53": ("RS", ("Pelotas", "Rio Grande", "Bagé")),
+    "54": ("RS", ("Caxias do Sul", "Passo Fundo", "Bento Gonçalves")),
+    "55": ("RS", ("Santa Maria", "Uruguaiana", "Santa Cruz do Sul")),
+    "61": ("DF", ("Brasília", "Taguatinga", "Ceilândia")),
+    "62": ("GO", ("Goiânia", "Aparecida de Goiânia", "Anápolis")),
+    "63": ("TO", ("Palmas", "Araguaína", "Gurupi")),
+    "64": ("GO", ("Rio Verde", "Itumbiara", "Jataí")),
+    "65": ("MT", ("Cuiabá", "Várzea Grande", "Cáceres")),
+    "66": ("MT", ("Rondonópolis", "Sinop", "Barra do Garças")),
+    "67": ("MS", ("Campo Grande", "Dourados", "Corumbá", "Três Lagoas")),
+    "68": ("AC", ("Rio Branco", "Cruzeiro do Sul")),
+    "69": ("RO", ("Porto Velho", "Ji-Paraná", "Ariquemes")),
+    "71": ("BA", ("Salvador", "Camaçari", "Lauro de Freitas")),
+    "73": ("BA", ("Ilhéus", "Itabuna", "Porto Seguro")),
+    "74": ("BA", ("Juazeiro", "Jacobina", "Senhor do Bonfim")),
+    "75": ("BA", ("Feira de Santana", "Alagoinhas", "Santo Antônio de Jesus")),
+    "77": ("BA", ("Vitória da Conquista", "Barreiras", "Guanambi")),
+    "79": ("SE", ("Aracaju", "Nossa Senhora do Socorro", "Lagarto")),
+    "81": ("PE", ("Recife", "Jaboatão dos Guararapes", "Olinda", "Caruaru")),
+    "82": ("AL", ("Maceió", "Arapiraca", "Palmeira dos Índios")),
+    "83": ("PB", ("João Pessoa", "Campina Grande", "Patos")),
+    "84": ("RN", ("Natal", "Mossoró", "Parnamirim")),
+    "85": ("CE", ("Fortaleza", "Caucaia", "Maracanaú")),
+    "86": ("PI", ("Teresina", "Parnaíba")),
+    "87": ("PE", ("Petrolina", "Garanhuns", "Arcoverde")),
+    "88": ("CE", ("Juazeiro do Norte", "Sobral", "Crato")),
+    "89": ("PI", ("Picos", "Floriano")),
+    "91": ("PA", ("Belém", "Ananindeua", "Castanhal")),
+    "92": ("AM", ("Manaus", "Parintins", "Itacoatiara")),
+    "93": ("PA", ("Santarém", "Altamira", "Itaituba")),
+    "94": ("PA", ("Marabá", "Parauapebas", "Redenção")),
+    "95": ("RR", ("Boa Vista",)),
+    "96": ("AP", ("Macapá", "Santana")),
+    "97": ("AM", ("Tefé", "Coari", "Tabatinga")),
+    "98": ("MA", ("São Luís", "São José de Ribamar", "Paço do Lumiar")),
+    "99": ("MA", ("Imperatriz", "Caxias", "Timon")),
+}
+
+# Tabela final, montada uma vez no import: DDD → {state, cities, url}
+DDD_INDEX: Dict[str, Dict] = {
+    ddd: {
+        "state": STATES[uf],
+        "cities": list(cities),
+        "url": DDD_URL_TEMPLATE.format(ddd=ddd),
+    }
+    for ddd, (uf, cities) in _RAW.items()
+}
+
+# Prefixo opcional (+55 ou 0 + código de operadora), DDD e número:
+# celular 9 + 8 dígitos ou fixo com 8 dígitos.
+PHONE_PATTERN = r"^(?:55|0(?:\d{2})?)?(\d{2})(?:9\d{8}|\d{8})$"
+_PHONE_RE = re.compile(PHONE_PATTERN)
+_NON_DIGITS = re.compile(r"\D")
+
+
+def extract_ddd(phone: str) -> Optional[str]:
+    """DDD do telefone, ou `None` se o formato/DDD não for reconhecido."""
+    match = _PHONE_RE.match(_NON_DIGITS.sub("", str(phone)))
+    if match and match.group(1) in DDD_INDEX:
+        return match.group(1)
+    return None
+
+
+def resolve_location(phone: str) -> Optional[Dict]:
+    """{state, cities, url} do telefone, ou `None` (cair no crew)."""
+    ddd = extract_ddd(phone)
+    if ddd is None:
+        return None
+    entry = DDD_INDEX[ddd]
+    return {"state": entry["state"], "cities": list(entry["cities"]), "url": entry["url"]}
+
+
+def resolve_many(phones: Iterable[str]):
+    """
+    Resolve um lote de telefones de uma vez (pandas, sem laço Python).
+
+    Retorna DataFrame com colunas phone, ddd, state, cities, url – linhas não
+    resolvidas ficam com `ddd` nulo.
+    """
+    import pandas as pd
+
+    phones = pd.Series(list(phones), dtype="string", name="phone")
+    ddd = (
+        phones.str.replace(r"\D", "", regex=True)
+        .str.extract(PHONE_PATTERN, expand=False)
+    )
+    ddd = ddd.where(ddd.isin(DDD_INDEX.keys()))
+    return pd.DataFrame({
+        "phone": phones,
+        "ddd": ddd,
+        "state": ddd.map({k: v["state"] for k, v in DDD_INDEX.items()}),
+        "cities": ddd.map({k: v["cities"] for k, v in DDD_INDEX.items()}),
+        "url": ddd.map({k: v["url"] for k, v in DDD_INDEX.items()}),
+    })
+
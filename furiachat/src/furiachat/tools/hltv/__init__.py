@@ -0,0 +1,68 @@
+# furiachat/tools/hltv/__init__.py
+"""
+Pacote único de scraping da HLTV.
+
+• `engine`   – `ScraperEngine`: sessão com pool, retry e cache LRU de HTML
+               compartilhado (single‑flight) para todo o processo
+• `registry` – parsers versionados, escolhidos por nome ou padrão de URL
+• `parsers`  – parsers v1 (time, stats, partida, notícia) e a API por URL
+
+Novo parser (ou nova versão quando a HLTV mudar a marcação):
+
+    from furiachat.src.furiachat.tools.hltv import register_parser
+
+    @register_parser("team_overview", r"/team/\\d+", version=2, detect="team")
+    def _team_overview_v2(soup, url): ...
+
+`hltv_scraper` e `hltv_scraper_2` continuam importáveis como aliases deste
+pacote.
+"""
+from .engine import (
+    HEADERS,
+    HLTV_BASE,
+    STATS_URL,
+    TEAM_ID,
+    TEAM_URL,
+    CacheInfo,
+    HTMLCache,
+    ScraperEngine,
+    fetch_html,
+    invalidate_html,
+)
+from .registry import NoParserError, ParserRegistry, ParserSpec, parse, parse_html, register_parser, registry
+from .parsers import (
+    discover_links,
+    parse_match_page,
+    parse_match_summary,
+    parse_news,
+    parse_stats_team,
+    parse_team_overview,
+    parse_team_stats,
+)
+
+__all__ = [
+    "HLTV_BASE",
+    "TEAM_ID",
+    "TEAM_URL",
+    "STATS_URL",
+    "HEADERS",
+    "CacheInfo",
+    "HTMLCache",
+    "ScraperEngine",
+    "fetch_html",
+    "invalidate_html",
+    "NoParserError",
+    "ParserSpec",
+    "ParserRegistry",
+    "registry",
+    "register_parser",
+    "parse",
+    "parse_html",
+    "discover_links",
+    "parse_team_overview",
+    "parse_stats_team",
+    "parse_team_stats",  # alias
+    "parse_match_summary",
+    "parse_match_page",  # alias
+    "parse_news",
+]
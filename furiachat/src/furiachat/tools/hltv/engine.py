@@ -0,0 +1,186 @@
+# furiachat/tools/hltv/engine.py
+"""
+Motor de download da HLTV: uma `requests.Session` com pool de conexões,
+retry com back‑off e um único cache LRU de HTML para o processo inteiro.
+
+Downloads simultâneos da mesma URL (ex.: snapshot + ferramenta em lote) são
+coalescidos: só uma thread baixa, as outras esperam e leem do cache.
+Mudanças detectadas no time (`change_detection`) invalidam só o HTML das
+páginas dependentes.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, NamedTuple, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from furiachat.utils.events import Event, bus
+from furiachat.utils.tracing import span
+
+__all__ = [
+    "HLTV_BASE",
+    "TEAM_ID",
+    "TEAM_URL",
+    "STATS_URL",
+    "HEADERS",
+    "CacheInfo",
+    "HTMLCache",
+    "ScraperEngine",
+    "engine",
+    "fetch_html",
+    "invalidate_html",
+]
+
+HLTV_BASE = "https://www.hltv.org"
+TEAM_ID = 8297  # FURIA
+TEAM_URL = f"{HLTV_BASE}/team/{TEAM_ID}/furia"
+STATS_URL = f"{HLTV_BASE}/stats/teams/{TEAM_ID}/furia"
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/123.0 Safari/537.36 (FuriaChat/1.0)"
+)
+HEADERS = {"User-Agent": USER_AGENT}
+
+
+# ───────────────────────────── CACHE ─────────────────────────────────── #
+
+class CacheInfo(NamedTuple):
+    """Mesmos campos do `cache_info()` do `functools.lru_cache`."""
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class HTMLCache:
+    """LRU como o `functools.lru_cache`, com invalidação por URL e single‑flight."""
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[str, str]" = OrderedDict()
+        self._loading: Dict[str, threading.Event] = {}
+
+    def get_or_load(self, url: str, load: Callable[[str], str]) -> Tuple[str, bool]:
+        """HTML de `url` e se veio do cache; baixa com `load` se preciso."""
+        while True:
+            with self._lock:
+                if url in self._data:
+                    self._data.move_to_end(url)
+                    self.hits += 1
+                    return self._data[url], True
+                pending = self._loading.get(url)
+                if pending is None:
+                    self._loading[url] = threading.Event()
+                    self.misses += 1
+                    break
+            pending.wait()  # outra thread já está baixando; se falhar, tentamos nós
+
+        try:
+            html = load(url)
+            with self._lock:
+                self._data[url] = html
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+            return html, False
+        finally:
+            with self._lock:
+                self._loading.pop(url).set()
+
+    def invalidate(self, url: str) -> bool:
+        with self._lock:
+            return self._data.pop(url, None) is not None
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+
+# ───────────────────────────── ENGINE ────────────────────────────────── #
+
+class ScraperEngine:
+    """Sessão HTTP compartilhada + cache de HTML."""
+
+    def __init__(self, cache_size: int = 128, pool_size: int = 16,
+                 max_retries: int = 3, timeout: int = 15):
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.cache = HTMLCache(cache_size)
+
+    def request(self, url: str) -> requests.Response:
+        """GET com back‑off exponencial; 4xx (exceto 429) não é repetido."""
+        delay = 1.5
+        with span("hltv.request", url=url) as sp:
+            for attempt in range(self.max_retries):
+                sp.set_attribute("attempts", attempt + 1)
+                try:
+                    resp = self.session.get(url, timeout=self.timeout)
+                    resp.raise_for_status()
+                    sp.set_attribute("status_code", resp.status_code)
+                    sp.set_attribute("bytes", len(resp.content))
+                    return resp
+                except requests.RequestException as exc:
+                    status = getattr(exc.response, "status_code", None)
+                    if attempt == self.max_retries - 1 or (status and 400 <= status < 500 and status != 429):
+                        raise
+                    time.sleep(delay)
+                    delay *= 2
+
+    def fetch(self, url: str) -> str:
+        """HTML bruto de `url`, do cache quando possível."""
+        with span("hltv.fetch_html", url=url) as sp:
+            html, hit = self.cache.get_or_load(url, lambda u: self.request(u).text)
+            sp.set_attribute("cache_hit", hit)
+            sp.set_attribute("bytes", len(html))
+        return html
+
+
+# motor padrão do processo: todos os parsers e shims passam por ele
+engine = ScraperEngine()
+
+
+def fetch_html(url: str) -> str:
+    """Baixa HTML bruto com cache em memória (motor compartilhado)."""
+    return engine.fetch(url)
+
+
+def invalidate_html(url: str) -> bool:
+    """Remove `url` do cache de HTML; devolve se havia algo em cache."""
+    return engine.cache.invalidate(url)
+
+
+# mesma interface do lru_cache para quem inspeciona/limpa o cache
+fetch_html.cache_info = engine.cache.cache_info  # type: ignore[attr-defined]
+fetch_html.cache_clear = engine.cache.cache_clear  # type: ignore[attr-defined]
+
+
+# ─────────────────── INVALIDAÇÃO POR EVENTOS ─────────────────────────── #
+
+def _invalidate_dependents(event: Event) -> None:
+    """Mudou algo no time: descarta só o HTML das páginas que dependem disso."""
+    changes = event.payload["changes"]
+    urls = {c["url"] for c in changes if c.get("url")}
+    if event.topic == "team.recent_results":
+        urls.add(STATS_URL)  # rating / mapas mudam com cada resultado novo
+    for url in urls:
+        invalidate_html(url)
+
+
+bus.subscribe("team.recent_results", _invalidate_dependents)
+bus.subscribe("team.next_matches", _invalidate_dependents)
@@ -0,0 +1,115 @@
+# furiachat/tools/hltv/registry.py
+"""
+Registro versionado de parsers HLTV.
+
+Cada parser recebe o `BeautifulSoup` já montado e a URL, e devolve um dict.
+É registrado com um nome, um padrão de URL e uma versão; quando a HLTV muda
+a marcação, registra‑se a `version=2` do mesmo nome e a v1 continua
+disponível via `get(name, version=1)`.
+
+    @register_parser("team_overview", r"/team/\\d+", version=1, detect="team")
+    def _team_overview(soup, url): ...
+
+    parse("https://www.hltv.org/team/8297/furia")        # escolhe pela URL
+    parse(url, "match_summary", version=1)               # parser explícito
+
+`detect` liga o resultado ao detector de mudanças (`change_detection`).
+"""
+from __future__ import annotations
+
+import re
+import threading
+from typing import Callable, Dict, List, NamedTuple, Optional, Pattern
+
+from bs4 import BeautifulSoup
+
+from furiachat.utils.tracing import span
+
+from ..change_detection import detector
+from . import engine
+
+__all__ = ["NoParserError", "ParserSpec", "ParserRegistry", "registry", "register_parser", "parse", "parse_html"]
+
+ParserFunc = Callable[[BeautifulSoup, str], Dict]
+
+
+class NoParserError(LookupError):
+    """Nenhum parser registrado para o nome/versão/URL pedido."""
+
+
+class ParserSpec(NamedTuple):
+    name: str
+    version: int
+    pattern: Pattern[str]
+    func: ParserFunc
+    detect: Optional[str]  # página para o detector de mudanças (team, stats, match)
+
+
+class ParserRegistry:
+    """Nome → versões; a busca por URL usa a versão mais nova de cada nome."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._specs: Dict[str, Dict[int, ParserSpec]] = {}
+
+    def register(self, name: str, pattern: str, version: int = 1,
+                 detect: Optional[str] = None) -> Callable[[ParserFunc], ParserFunc]:
+        def decorator(func: ParserFunc) -> ParserFunc:
+            spec = ParserSpec(name, version, re.compile(pattern), func, detect)
+            with self._lock:
+                self._specs.setdefault(name, {})[version] = spec
+            return func
+        return decorator
+
+    def get(self, name: str, version: Optional[int] = None) -> ParserSpec:
+        with self._lock:
+            versions = self._specs.get(name)
+            if not versions:
+                raise NoParserError(f"parser desconhecido: {name}")
+            if version is None:
+                return versions[max(versions)]
+            if version not in versions:
+                raise NoParserError(f"{name} não tem versão {version}")
+            return versions[version]
+
+    def match(self, url: str) -> ParserSpec:
+        """Parser (versão mais nova) cujo padrão casa com a URL."""
+        with self._lock:
+            latest = [versions[max(versions)] for versions in self._specs.values()]
+        for spec in latest:
+            if spec.pattern.search(url):
+                return spec
+        raise NoParserError(f"nenhum parser para {url}")
+
+    def names(self) -> List[str]:
+        with self._lock:
+            return list(self._specs)
+
+    def versions(self, name: str) -> List[int]:
+        with self._lock:
+            return sorted(self._specs.get(name, ()))
+
+
+registry = ParserRegistry()
+register_parser = registry.register
+
+
+def parse_html(html: str, url: str, name: Optional[str] = None,
+               version: Optional[int] = None) -> Dict:
+    """Roda o parser sobre HTML já baixado (sem rede, sem detector)."""
+    spec = registry.get(name, version) if name else registry.match(url)
+    data = spec.func(BeautifulSoup(html, "lxml"), url)
+    data.setdefault("source", url)
+    return data
+
+
+def parse(url: str, name: Optional[str] = None, version: Optional[int] = None) -> Dict:
+    """Baixa (via cache do motor), parseia e alimenta o detector de mudanças."""
+    spec = registry.get(name, version) if name else registry.match(url)
+    with span(f"hltv.parse_{spec.name}", version=spec.version):
+        html = engine.fetch_html(url)
+        data = spec.func(BeautifulSoup(html, "lxml"), url)
+        data.setdefault("source", url)
+    if spec.detect:
+        detector.observe(spec.detect, url, data)
+    return data
@@ -0,0 +1,129 @@
+# furiachat/utils/columnar.py
+"""
+Enriquecimento colunar e armazenamento em dataset Parquet particionado.
+
+Em vez de montar um dict por lead (custo, DDD via `split`, tokens…), o
+`LeadProfileFlow` junta os resultados em lotes e chama `enrich_batch`, que
+calcula tudo por coluna com pyarrow/numpy:
+
+• custo vetorizado sobre os arrays de tokens (`model_cost_array`);
+• DDD extraído da URL por regex vetorizada (`pyarrow.compute.extract_regex`).
+
+`ResultStore` acrescenta cada lote a um dataset Parquet particionado por
+`run_date` (estilo Hive), que pode ser consultado depois com pyarrow, pandas
+ou DuckDB sem rodar o fluxo de novo.
+"""
+from __future__ import annotations
+
+import os
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+from furiachat.utils.cost import model_cost_array
+
+__all__ = ["RESULT_SCHEMA", "enrich_batch", "ResultStore"]
+
+RESULT_SCHEMA = pa.schema([
+    ("name", pa.string()),
+    ("phone", pa.string()),
+    ("ddd", pa.string()),
+    ("state", pa.string()),
+    ("cities", pa.list_(pa.string())),
+    ("url", pa.string()),
+    ("resolved_by", pa.string()),        # "index" | "crew"
+    ("prompt_tokens", pa.int64()),
+    ("completion_tokens", pa.int64()),
+    ("cached_prompt_tokens", pa.int64()),
+    ("total_tokens", pa.int64()),
+    ("usd_cost", pa.float64()),
+    ("run_id", pa.string()),
+    ("run_date", pa.string()),
+])
+
+_TOKEN_KEYS = ("prompt_tokens", "completion_tokens", "cached_prompt_tokens", "total_tokens")
+_DDD_REGEX = r"ddd-(?P<ddd>\d{2})"
+
+
+def enrich_batch(
+    rows: Sequence[Tuple[Dict, Dict, Optional[Dict]]],
+    run_id: str = "",
+    model: str = "gpt-4o-mini",
+) -> pa.Table:
+    """
+    Monta a tabela enriquecida de um lote.
+
+    `rows` = [(lead {name, phone}, data {state, cities, url}, usage | None)],
+    com `usage` já normalizado por `usage_to_dict` (None = índice local).
+    """
+    leads, datas, usages = zip(*rows) if rows else ((), (), ())
+    zero = dict.fromkeys(_TOKEN_KEYS, 0)
+    tokens = {
+        key: pa.array([(u or zero).get(key, 0) for u in usages], pa.int64())
+        for key in _TOKEN_KEYS
+    }
+    url = pa.array([d["url"] for d in datas], pa.string())
+    run_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+    columns = {
+        "name": pa.array([lead["name"] for lead in leads], pa.string()),
+        "phone": pa.array([lead["phone"] for lead in leads], pa.string()),
+        "ddd": pc.struct_field(pc.extract_regex(url, _DDD_REGEX), [0]),
+        "state": pa.array([d["state"] for d in datas], pa.string()),
+        "cities": pa.array([list(d["cities"]) for d in datas], pa.list_(pa.string())),
+        "url": url,
+        "resolved_by": pa.array(["index" if u is None else "crew" for u in usages], pa.string()),
+        **tokens,
+        "usd_cost": pa.array(model_cost_array(
+            tokens["prompt_tokens"].to_numpy(),
+            tokens["completion_tokens"].to_numpy(),
+            tokens["cached_prompt_tokens"].to_numpy(),
+            model,
+        ), pa.float64()),
+        "run_id": pa.array([run_id] * len(leads), pa.string()),
+        "run_date": pa.array([run_date] * len(leads), pa.string()),
+    }
+    return pa.table(columns, schema=RESULT_SCHEMA)
+
+
+class ResultStore:
+    """Dataset Parquet append‑only, particionado por `run_date` (Hive)."""
+
+    def __init__(self, root: str, partition_cols: Sequence[str] = ("run_date",)):
+        self.root = root
+        self.partitioning = ds.partitioning(
+            pa.schema([RESULT_SCHEMA.field(c) for c in partition_cols]), flavor="hive")
+
+    def append(self, table: pa.Table) -> None:
+        if table.num_rows == 0:
+            return
+        ds.write_dataset(
+            table,
+            self.root,
+            format="parquet",
+            partitioning=self.partitioning,
+            # nome único por lote: nunca sobrescreve arquivos anteriores
+            basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+        )
+
+    def dataset(self) -> ds.Dataset:
+        return ds.dataset(self.root, format="parquet",
+                          schema=RESULT_SCHEMA, partitioning=self.partitioning)
+
+    def iter_rows(self, batch_size: int = 10_000) -> Iterator[Dict]:
+        """Relê o dataset lote a lote, como dicts (memória limitada)."""
+        if not os.path.isdir(self.root):
+            return
+        for batch in self.dataset().to_batches(batch_size=batch_size):
+            yield from batch.to_pylist()
+
+    def phones(self) -> List[str]:
+        """Telefones já gravados (útil para reconstruir um checkpoint)."""
+        if not os.path.isdir(self.root):
+            return []
+        return self.dataset().to_table(columns=["phone"])["phone"].to_pylist()
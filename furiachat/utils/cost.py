@@ -1,13 +1,101 @@
 # cost.py
+"""
+Tabela de preços por modelo e cálculo de custo em dólares.
+
+Preços em USD por 1M tokens, conforme tabela pública da OpenAI.  Tokens de
+prompt servidos do cache (`cached_prompt_tokens`) são cobrados pelo preço
+`cached_input` – o restante do prompt pelo preço cheio.  Modelo fora da
+tabela custa 0 em `model_cost`/`model_cost_array` (com um aviso no log): a
+chamada ao LLM já foi paga e a resposta não pode ser descartada por isso.
+"""
+import logging
+from typing import Dict, NamedTuple, Set
+
+log = logging.getLogger(__name__)
+
+
+class ModelPrice(NamedTuple):
+    input: float
+    cached_input: float
+    output: float
+
+
+MODEL_PRICES: Dict[str, ModelPrice] = {
+    "gpt-4.1-nano":  ModelPrice(input=0.10, cached_input=0.025, output=0.40),
+    "gpt-4o-mini":   ModelPrice(input=0.15, cached_input=0.075, output=0.60),
+    "gpt-4.1-mini":  ModelPrice(input=0.40, cached_input=0.10, output=1.60),
+    "gpt-3.5-turbo": ModelPrice(input=0.50, cached_input=0.50, output=1.50),
+    "gpt-4.1":       ModelPrice(input=2.00, cached_input=0.50, output=8.00),
+    "gpt-4o":        ModelPrice(input=2.50, cached_input=1.25, output=10.00),
+}
+
+
+def get_price(model: str) -> ModelPrice:
+    """
+    Resolve o preço de `model`, aceitando prefixo de provedor ("openai/...")
+    e sufixo de versão ("gpt-4o-mini-2024-07-18").
+    """
+    name = model.split("/")[-1]
+    if name in MODEL_PRICES:
+        return MODEL_PRICES[name]
+    # prefixo mais longo primeiro: "gpt-4o-mini-…" não pode cair em "gpt-4o"
+    for known in sorted(MODEL_PRICES, key=len, reverse=True):
+        if name.startswith(known):
+            return MODEL_PRICES[known]
+    raise KeyError(f"modelo sem preço cadastrado: {model}")
+
+
+_UNPRICED = ModelPrice(input=0.0, cached_input=0.0, output=0.0)
+_warned: Set[str] = set()
+
+
+def _price_or_zero(model: str) -> ModelPrice:
+    """`get_price`, mas modelo desconhecido vira preço zero e um aviso (uma vez)."""
+    try:
+        return get_price(model)
+    except KeyError:
+        if model not in _warned:
+            _warned.add(model)
+            log.warning("modelo sem preço cadastrado: %s (custo registrado como 0)", model)
+        return _UNPRICED
+
+
+def model_cost(usage: dict, model: str) -> float:
+    """
+    Calcula o custo em dólares de `usage` para `model`.
+    usage = {'prompt_tokens': int, 'completion_tokens': int,
+             'cached_prompt_tokens': int (opcional)}
+    """
+    price = _price_or_zero(model)
+    cached = usage.get("cached_prompt_tokens", 0)
+    prompt_cost = (usage["prompt_tokens"] - cached) * price.input
+    cached_cost = cached * price.cached_input
+    completion_cost = usage["completion_tokens"] * price.output
+    return round((prompt_cost + cached_cost + completion_cost) / 1_000_000, 6)   # 6 casas decimais
+
 
 def gpt4o_mini_cost(usage: dict) -> float:
     """
     Calcula o custo em dólares para GPT-4o-mini.
     usage = {'prompt_tokens': int, 'completion_tokens': int}
     """
-    PRICE_PROMPT = 0.0005 / 1000   # USD por token
-    PRICE_COMPLETION = 0.0015 / 1000
+    return model_cost(usage, "gpt-4o-mini")
+
+
+def model_cost_array(prompt_tokens, completion_tokens, cached_prompt_tokens=None,
+                     model: str = "gpt-4o-mini"):
+    """
+    Versão vetorizada de `model_cost`: recebe arrays (numpy/pyarrow/listas)
+    de tokens e devolve array numpy de custos em dólares, 6 casas decimais.
+    """
+    import numpy as np
 
-    prompt_cost = usage["prompt_tokens"] * PRICE_PROMPT
-    completion_cost = usage["completion_tokens"] * PRICE_COMPLETION
-    return round(prompt_cost + completion_cost, 6)   # 6 casas decimais
+    price = _price_or_zero(model)
+    prompt = np.asarray(prompt_tokens, dtype=np.float64)
+    completion = np.asarray(completion_tokens, dtype=np.float64)
+    cached = (np.zeros_like(prompt) if cached_prompt_tokens is None
+              else np.asarray(cached_prompt_tokens, dtype=np.float64))
+    cost = ((prompt - cached) * price.input
+            + cached * price.cached_input
+            + completion * price.output) / 1_000_000
+    return np.round(cost, 6)
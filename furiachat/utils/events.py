@@ -0,0 +1,78 @@
+# furiachat/utils/events.py
+"""
+Barramento de eventos em processo (pub/sub síncrono).
+
+Tópicos são strings com pontos (`team.roster`, `match.score`…); quem assina
+um prefixo (`"team."`) recebe todos os tópicos abaixo dele, e `""` recebe
+tudo.  Os handlers rodam na thread de quem publica; exceção num handler é
+logada e não impede os demais.
+
+Uso:
+    from furiachat.utils.events import bus
+
+    bus.subscribe("team.", lambda event: print(event.topic, event.payload))
+    bus.publish("team.roster", {"changes": [...]})
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Tuple
+
+__all__ = ["Event", "EventBus", "bus"]
+
+log = logging.getLogger(__name__)
+
+
+class Event(NamedTuple):
+    topic: str
+    payload: Dict[str, Any]
+    ts: float
+
+
+Handler = Callable[[Event], None]
+
+
+class EventBus:
+    """Pub/sub thread‑safe com assinatura por prefixo de tópico."""
+
+    def __init__(self, history: int = 100):
+        self._lock = threading.Lock()
+        self._subscribers: List[Tuple[str, Handler]] = []
+        self._history: Deque[Event] = deque(maxlen=history)
+
+    def subscribe(self, prefix: str, handler: Handler) -> Callable[[], None]:
+        """Assina `prefix`; devolve função que cancela a assinatura."""
+        entry = (prefix, handler)
+        with self._lock:
+            self._subscribers.append(entry)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if entry in self._subscribers:
+                    self._subscribers.remove(entry)
+        return unsubscribe
+
+    def publish(self, topic: str, payload: Dict[str, Any]) -> Event:
+        event = Event(topic, payload, time.time())
+        with self._lock:
+            self._history.append(event)
+            handlers = [h for prefix, h in self._subscribers if topic.startswith(prefix)]
+        for handler in handlers:
+            try:
+                handler(event)
+            except Exception:
+                log.exception("handler de %s falhou", topic)
+        return event
+
+    def recent(self, prefix: str = "", limit: int = 20) -> List[Event]:
+        """Últimos eventos publicados (mais recente por último)."""
+        with self._lock:
+            events = [e for e in self._history if e.topic.startswith(prefix)]
+        return events[-limit:]
+
+
+# barramento padrão do processo
+bus = EventBus()
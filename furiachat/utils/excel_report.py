@@ -1,22 +1,137 @@
 # excel_report.py
 """
 Gera a planilha Auditoria_da_busca_<nome>_<telefone>.xlsx                      ✓
+
+Para lotes, `AuditReportWriter` / `write_audit_report` gravam um único
+relatório em streaming (xlsx em modo *constant_memory*, CSV ou Parquet):
+as linhas vão para o disco conforme chegam, com memória constante.
 """
-import pandas as pd                                        # pandas ExcelWriter :contentReference[oaicite:7]{index=7}
+import csv
+import os
 from io import BytesIO
+from typing import Dict, Iterable, List, Optional
 
+AUDIT_COLUMNS = ["nome", "telefone", "link_claro_ddd", "ddd", "cidades", "estado"]
+XLSX_MAX_ROWS = 1_048_576          # limite do Excel por planilha (com cabeçalho)
 
-def build_audit_excel(name, phone, ddd, data) -> BytesIO:
-    df = pd.DataFrame([{
+
+def audit_row(name, phone, ddd, data) -> Dict:
+    return {
         "nome": name,
         "telefone": phone,
         "link_claro_ddd": data["url"],
         "ddd": ddd,
         "cidades": ", ".join(data["cities"]),
         "estado": data["state"]
-    }])
+    }
+
+
+def build_audit_excel(name, phone, ddd, data) -> BytesIO:
+    import pandas as pd                                    # só quando um relatório é pedido
+    df = pd.DataFrame([audit_row(name, phone, ddd, data)])
     buffer = BytesIO()
     with pd.ExcelWriter(buffer, engine="xlsxwriter") as writer:
         df.to_excel(writer, index=False, sheet_name="auditoria")
     buffer.seek(0)
     return buffer
+
+
+# ───────────────────────── BULK / STREAMING ────────────────────────── #
+
+class AuditReportWriter:
+    """
+    Escreve linhas de auditoria em streaming num único arquivo.
+
+    `fmt` é "xlsx", "csv" ou "parquet" (padrão: extensão de `path`).  Aceita
+    os dicts enriquecidos do `LeadProfileFlow` ({name, phone, ddd, state,
+    cities, url, ...}); registros com `error` são ignorados.
+    """
+
+    def __init__(self, path: str, fmt: Optional[str] = None,
+                 flush_every: int = 1000, sheet_name: str = "auditoria"):
+        self.path = path
+        self.fmt = (fmt or os.path.splitext(path)[1].lstrip(".")).lower()
+        self.flush_every = flush_every
+        self.sheet_name = sheet_name
+        self.rows = 0
+        self._buffer: List[Dict] = []
+
+        if self.fmt == "xlsx":
+            import xlsxwriter
+            # constant_memory: cada linha vai para arquivo temporário assim
+            # que a próxima começa – a planilha nunca fica inteira em RAM
+            self._book = xlsxwriter.Workbook(
+                path, {"constant_memory": True, "strings_to_urls": False})
+            self._sheets = 0
+            self._new_sheet()
+        elif self.fmt == "csv":
+            self._fh = open(path, "w", encoding="utf-8", newline="")
+            self._csv = csv.DictWriter(self._fh, fieldnames=AUDIT_COLUMNS)
+            self._csv.writeheader()
+        elif self.fmt == "parquet":
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            self._schema = pa.schema([(col, pa.string()) for col in AUDIT_COLUMNS])
+            self._parquet = pq.ParquetWriter(path, self._schema)
+        else:
+            raise ValueError(f"formato de relatório desconhecido: {self.fmt}")
+
+    def _new_sheet(self) -> None:
+        self._sheets += 1
+        name = self.sheet_name if self._sheets == 1 else f"{self.sheet_name}_{self._sheets}"
+        self._sheet = self._book.add_worksheet(name)
+        self._sheet.write_row(0, 0, AUDIT_COLUMNS)
+        self._sheet_row = 1
+
+    def write(self, lead: Dict) -> None:
+        if lead.get("error"):
+            return
+        row = audit_row(lead["name"], lead["phone"], lead["ddd"], lead)
+        self.rows += 1
+
+        if self.fmt == "xlsx":
+            if self._sheet_row >= XLSX_MAX_ROWS:
+                self._new_sheet()
+            self._sheet.write_row(self._sheet_row, 0, [row[c] for c in AUDIT_COLUMNS])
+            self._sheet_row += 1
+        elif self.fmt == "csv":
+            self._csv.writerow(row)
+            if self.rows % self.flush_every == 0:
+                self._fh.flush()
+        else:
+            self._buffer.append(row)
+            if len(self._buffer) >= self.flush_every:
+                self._flush_parquet()
+
+    def _flush_parquet(self) -> None:
+        if not self._buffer:
+            return
+        import pyarrow as pa
+        columns = {c: [None if r[c] is None else str(r[c]) for r in self._buffer]
+                   for c in AUDIT_COLUMNS}
+        self._parquet.write_table(pa.table(columns, schema=self._schema))
+        self._buffer.clear()
+
+    def close(self) -> None:
+        if self.fmt == "xlsx":
+            self._book.close()
+        elif self.fmt == "csv":
+            self._fh.close()
+        else:
+            self._flush_parquet()
+            self._parquet.close()
+
+    def __enter__(self) -> "AuditReportWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def write_audit_report(leads: Iterable[Dict], path: str, fmt: Optional[str] = None,
+                       flush_every: int = 1000) -> int:
+    """Grava `leads` (qualquer iterável/gerador) em `path`; devolve nº de linhas."""
+    with AuditReportWriter(path, fmt, flush_every) as writer:
+        for lead in leads:
+            writer.write(lead)
+    return writer.rows
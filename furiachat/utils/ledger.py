@@ -0,0 +1,157 @@
+# furiachat/utils/ledger.py
+"""
+Livro‑razão de uso: cada pergunta respondida vira uma linha em SQLite.
+
+Guarda hash da pergunta, modelo, tokens (prompt / completion / cache),
+custo em USD, nº de chamadas de ferramenta, tempo de parede e flags de cache,
+para descobrir quais classes de pergunta são caras ou lentas.  As consultas
+`by_hour`, `by_session`, `by_model` e `by_intent` agregam direto no SQLite.
+
+Uma conexão por operação: seguro para threads do Streamlit e do batch runner.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import time
+from contextlib import closing
+from typing import Dict, List, Optional
+
+__all__ = ["DEFAULT_LEDGER_PATH", "UsageLedger", "question_hash"]
+
+DEFAULT_LEDGER_PATH = os.environ.get("FURIACHAT_LEDGER", "furiachat_usage.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id                   INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts                   REAL    NOT NULL,
+    session_id           TEXT    NOT NULL DEFAULT '',
+    question_hash        TEXT    NOT NULL,
+    intent               TEXT    NOT NULL DEFAULT '',
+    model                TEXT    NOT NULL,
+    prompt_tokens        INTEGER NOT NULL DEFAULT 0,
+    completion_tokens    INTEGER NOT NULL DEFAULT 0,
+    cached_prompt_tokens INTEGER NOT NULL DEFAULT 0,
+    total_tokens         INTEGER NOT NULL DEFAULT 0,
+    usd_cost             REAL    NOT NULL DEFAULT 0,
+    tool_calls           INTEGER NOT NULL DEFAULT 0,
+    wall_s               REAL    NOT NULL DEFAULT 0,
+    snapshot_hit         INTEGER NOT NULL DEFAULT 0,
+    html_cache_hits      INTEGER NOT NULL DEFAULT 0,
+    html_cache_misses    INTEGER NOT NULL DEFAULT 0,
+    error                TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_ts ON runs (ts);
+CREATE INDEX IF NOT EXISTS runs_session ON runs (session_id);
+"""
+
+_COLUMNS = (
+    "ts", "session_id", "question_hash", "intent", "model",
+    "prompt_tokens", "completion_tokens", "cached_prompt_tokens", "total_tokens",
+    "usd_cost", "tool_calls", "wall_s", "snapshot_hit",
+    "html_cache_hits", "html_cache_misses", "error",
+)
+
+_AGGREGATES = """
+    COUNT(*)                       AS runs,
+    ROUND(SUM(usd_cost), 6)        AS usd_cost,
+    ROUND(AVG(usd_cost), 6)        AS avg_usd_cost,
+    SUM(total_tokens)              AS total_tokens,
+    ROUND(AVG(total_tokens), 1)    AS avg_tokens,
+    ROUND(AVG(wall_s), 3)          AS avg_wall_s,
+    ROUND(MAX(wall_s), 3)          AS max_wall_s,
+    ROUND(AVG(tool_calls), 2)      AS avg_tool_calls,
+    ROUND(AVG(snapshot_hit), 3)    AS snapshot_hit_rate,
+    SUM(error IS NOT NULL)         AS errors
+"""
+
+
+def question_hash(question: str) -> str:
+    """Hash estável da pergunta normalizada (sem guardar o texto)."""
+    normalized = " ".join(question.lower().split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16]
+
+
+class UsageLedger:
+    """Ledger append‑only em SQLite com consultas agregadas."""
+
+    def __init__(self, path: str = DEFAULT_LEDGER_PATH):
+        self.path = path
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    # ───────────────────────── escrita ───────────────────────── #
+
+    def record(self, question: str, answer: Dict, session_id: str = "",
+               wall_s: float = 0.0, error: Optional[str] = None) -> None:
+        """
+        Grava uma execução a partir do dict devolvido por `run_pantera_task`.
+
+        Execução com erro chega com `answer` parcial: sem `intent`, ele é
+        classificado a partir da pergunta; o chamador informa `model`.
+        """
+        intent = answer.get("intent")
+        if not intent:
+            from agents.model_router import classify_intent
+            intent = classify_intent(question)
+        row = {
+            "ts": time.time(),
+            "session_id": session_id,
+            "question_hash": question_hash(question),
+            "intent": intent,
+            "model": answer.get("model", ""),
+            "prompt_tokens": answer.get("prompt_tokens", 0),
+            "completion_tokens": answer.get("completion_tokens", 0),
+            "cached_prompt_tokens": answer.get("cached_prompt_tokens", 0),
+            "total_tokens": answer.get("total_tokens", 0),
+            "usd_cost": answer.get("usd_cost", 0.0),
+            "tool_calls": answer.get("tool_calls", 0),
+            "wall_s": wall_s,
+            "snapshot_hit": int(bool(answer.get("snapshot_hit", False))),
+            "html_cache_hits": answer.get("html_cache_hits", 0),
+            "html_cache_misses": answer.get("html_cache_misses", 0),
+            "error": error,
+        }
+        sql = (f"INSERT INTO runs ({', '.join(_COLUMNS)}) "
+               f"VALUES ({', '.join('?' for _ in _COLUMNS)})")
+        with closing(self._connect()) as conn, conn:
+            conn.execute(sql, [row[c] for c in _COLUMNS])
+
+    # ───────────────────────── leitura ───────────────────────── #
+
+    def _group(self, key_sql: str, alias: str, since: Optional[float],
+               order: str, limit: Optional[int]) -> List[Dict]:
+        sql = (f"SELECT {key_sql} AS {alias}, {_AGGREGATES} FROM runs "
+               f"WHERE ts >= ? GROUP BY {alias} ORDER BY {order}")
+        params: list = [since or 0]
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with closing(self._connect()) as conn:
+            return [dict(r) for r in conn.execute(sql, params)]
+
+    def by_hour(self, since: Optional[float] = None, limit: Optional[int] = None) -> List[Dict]:
+        return self._group("strftime('%Y-%m-%d %H:00', ts, 'unixepoch')", "hour",
+                           since, "hour DESC", limit)
+
+    def by_session(self, since: Optional[float] = None, limit: Optional[int] = None) -> List[Dict]:
+        return self._group("session_id", "session_id", since, "usd_cost DESC", limit)
+
+    def by_model(self, since: Optional[float] = None, limit: Optional[int] = None) -> List[Dict]:
+        return self._group("model", "model", since, "usd_cost DESC", limit)
+
+    def by_intent(self, since: Optional[float] = None, limit: Optional[int] = None) -> List[Dict]:
+        return self._group("intent", "intent", since, "usd_cost DESC", limit)
+
+    def totals(self, since: Optional[float] = None) -> Dict:
+        with closing(self._connect()) as conn:
+            row = conn.execute(f"SELECT {_AGGREGATES} FROM runs WHERE ts >= ?",
+                               [since or 0]).fetchone()
+        return dict(row)
@@ -0,0 +1,141 @@
+# furiachat/utils/memory.py
+"""
+Memória de conversa limitada para o Pantera‑Bot.
+
+Mantém uma janela deslizante com os turnos mais recentes e um resumo
+acumulado dos turnos antigos.  O texto devolvido por `render()` nunca passa
+de `token_budget` tokens (a cota do resumo acompanha o orçamento, e `0`
+desliga o histórico), então o prompt (e a latência) de cada pergunta fica
+estável mesmo em conversas longas.
+
+O resumo padrão é extrativo (sem chamada ao LLM); um `summarizer` próprio
+pode ser passado com a assinatura `summarizer(summary, question, answer) -> str`.
+"""
+from __future__ import annotations
+
+import re
+from collections import deque
+from typing import Callable, Deque, Iterable, List, Optional, Sequence, Tuple
+
+__all__ = ["ConversationMemory", "count_tokens"]
+
+Summarizer = Callable[[str, str, str], str]
+
+_encoder = None
+
+
+def count_tokens(text: str) -> int:
+    """Conta tokens com *tiktoken* se disponível; senão estima ~4 chars/token."""
+    global _encoder
+    if _encoder is None:
+        try:
+            import tiktoken
+            _encoder = tiktoken.get_encoding("o200k_base")
+        except Exception:
+            _encoder = False
+    if _encoder:
+        return len(_encoder.encode(text))
+    return len(text) // 4 + 1
+
+
+def _first_sentence(text: str, limit: int) -> str:
+    text = " ".join(text.split())
+    sentence = re.split(r"(?<=[.!?])\s", text, maxsplit=1)[0]
+    return sentence if len(sentence) <= limit else sentence[: limit - 1] + "…"
+
+
+def extractive_summarizer(summary: str, question: str, answer: str) -> str:
+    """Acrescenta uma linha `P: … → R: …` ao resumo."""
+    line = f"- P: {_first_sentence(question, 120)} → R: {_first_sentence(answer, 160)}"
+    return f"{summary}\n{line}" if summary else line
+
+
+class ConversationMemory:
+    """Janela de turnos recentes + resumo rolante sob um orçamento de tokens."""
+
+    def __init__(
+        self,
+        token_budget: int = 800,
+        window_turns: int = 3,
+        summary_share: float = 0.4,
+        summarizer: Optional[Summarizer] = None,
+    ) -> None:
+        self.token_budget = token_budget
+        self.window_turns = window_turns
+        self.summary_share = summary_share
+        self.summarizer = summarizer or extractive_summarizer
+        self.turns: Deque[Tuple[str, str]] = deque()
+        self.summary = ""
+
+    @property
+    def summary_budget(self) -> int:
+        """Cota do resumo, sempre proporcional ao `token_budget` atual."""
+        return int(max(self.token_budget, 0) * self.summary_share)
+
+    # ───────────────────────── escrita ───────────────────────── #
+
+    def add_turn(self, question: str, answer: str) -> None:
+        self.turns.append((question, answer))
+        while self.turns and (
+            len(self.turns) > self.window_turns
+            or count_tokens(self._compose(self.summary.splitlines(), self.turns)) > self.token_budget
+        ):
+            self._fold_oldest()
+
+    def clear(self) -> None:
+        self.turns.clear()
+        self.summary = ""
+
+    def _fold_oldest(self) -> None:
+        question, answer = self.turns.popleft()
+        self.summary = self.summarizer(self.summary, question, answer)
+        self.summary = "\n".join(self._summary_lines())
+
+    def _summary_lines(self) -> List[str]:
+        """Linhas do resumo, sem as mais antigas que estouram a cota."""
+        lines = self.summary.splitlines()
+        while lines and count_tokens("\n".join(lines)) > self.summary_budget:
+            lines.pop(0)
+        return lines
+
+    # ───────────────────────── leitura ───────────────────────── #
+
+    @staticmethod
+    def _compose(summary: Sequence[str], turns: Iterable[Tuple[str, str]]) -> str:
+        parts = []
+        if summary:
+            parts.append("Resumo de turnos anteriores:\n" + "\n".join(summary))
+        recent = "\n".join(f"Usuário: {q}\nPantera‑Bot: {a}" for q, a in turns)
+        if recent:
+            parts.append(f"Turnos recentes:\n{recent}")
+        return "\n\n".join(parts)
+
+    def render(self) -> str:
+        """Bloco de contexto pronto para o prompt ("" se não há histórico).
+
+        O orçamento é aplicado aqui também, pois `token_budget` pode diminuir
+        entre uma pergunta e outra: sai primeiro o resumo mais antigo, depois
+        os turnos mais antigos; se nenhum turno couber, fica só o final do
+        resumo.
+        """
+        if self.token_budget <= 0:
+            return ""
+        lines = self._summary_lines()
+        summary, turns = list(lines), list(self.turns)
+        text = self._compose(summary, turns)
+        while count_tokens(text) > self.token_budget and (summary or turns):
+            if summary:
+                summary.pop(0)
+            else:
+                turns.pop(0)
+            text = self._compose(summary, turns)
+        if not turns:
+            summary = lines
+            text = self._compose(summary, ())
+            while summary and count_tokens(text) > self.token_budget:
+                summary.pop(0)
+                text = self._compose(summary, ())
+        return text
+
+    def __len__(self) -> int:
+        return len(self.turns)
@@ -0,0 +1,294 @@
+# furiachat/utils/tracing.py
+"""
+Tracing leve do caminho quente: fetch → parse → tool → LLM.
+
+Spans aninhados (via `contextvars`, então atravessam `asyncio.to_thread` e
+`Crew.kickoff_async`) com tempo em nanossegundos e atributos livres (bytes,
+cache hit, tokens…).  Nenhum backend é obrigatório: os traces completos mais
+recentes ficam em memória para a UI (`get_trace`) e, se a exportação estiver
+ligada, cada span terminado vira uma linha JSONL no formato do
+`ConsoleSpanExporter` do OpenTelemetry (`name`, `context.trace_id/span_id`,
+`parent_id`, `start_time`, `end_time`, `attributes`, `status`).
+
+Uso:
+    with span("hltv.fetch_html", url=url) as sp:
+        ...
+        sp.set_attribute("bytes", len(html))
+
+    @traced("hltv.parse_team_overview")
+    def parse_team_overview(...): ...
+
+Exportação (desligada por padrão): `configure("furiachat_traces.jsonl")` ou
+a variável `FURIACHAT_TRACE_FILE`.  O span só entra numa fila; uma thread
+grava em lotes e roda o arquivo ao passar de `max_bytes` (`arquivo.1`,
+`arquivo.2`… até `backups`).  Com a fila cheia, spans são descartados em vez
+de segurar o caminho quente.
+"""
+from __future__ import annotations
+
+import atexit
+import functools
+import inspect
+import json
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+__all__ = ["Span", "span", "traced", "current_span", "configure", "flush", "get_trace",
+           "waterfall_rows"]
+
+_current: ContextVar[Optional["Span"]] = ContextVar("furiachat_span", default=None)
+
+MAX_BYTES = 20 * 1024 * 1024  # por arquivo, antes de rodar
+BACKUPS = 3
+MAX_QUEUE = 10_000            # spans aguardando gravação
+BATCH_SIZE = 500
+
+MAX_TRACES = 50
+_traces_lock = threading.Lock()
+_open: Dict[str, List[Dict]] = {}                      # trace_id → spans terminados
+_finished: "OrderedDict[str, List[Dict]]" = OrderedDict()  # últimos traces completos
+
+
+def _iso(ns: int) -> str:
+    return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc).isoformat()
+
+
+class Span:
+    __slots__ = ("name", "trace_id", "span_id", "parent_id",
+                 "start_ns", "end_ns", "attributes", "status", "_perf0")
+
+    def __init__(self, name: str, parent: Optional["Span"], attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = parent.trace_id if parent else os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = attributes
+        self.status = "UNSET"
+        self.start_ns = time.time_ns()
+        self.end_ns = self.start_ns
+        self._perf0 = time.perf_counter_ns()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "context": {"trace_id": f"0x{self.trace_id}", "span_id": f"0x{self.span_id}"},
+            "kind": "SpanKind.INTERNAL",
+            "parent_id": f"0x{self.parent_id}" if self.parent_id else None,
+            "start_time": _iso(self.start_ns),
+            "end_time": _iso(self.end_ns),
+            "duration_ms": round(self.duration_ms, 3),
+            "status": {"status_code": self.status},
+            "attributes": self.attributes,
+        }
+
+
+# ───────────────────────── EXPORTAÇÃO ───────────────────────── #
+
+class _JsonlExporter:
+    """Fila + thread gravadora: o span terminado nunca espera por disco."""
+
+    def __init__(self, path: str, max_bytes: int, backups: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.dropped = 0
+        self._queue: "queue.Queue[Optional[Dict]]" = queue.Queue(MAX_QUEUE)
+        self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+        self._thread.start()
+
+    def submit(self, record: Dict) -> None:
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self) -> None:
+        self._queue.join()
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            records = [r for r in batch if r is not None]
+            try:
+                if records:
+                    self._write(records)
+            except OSError:
+                self.dropped += len(records)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if len(records) < len(batch):  # sentinela de `close`
+                return
+
+    def _write(self, records: List[Dict]) -> None:
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        fh = open(self.path, "a", encoding="utf-8")
+        try:
+            for record in records:
+                line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+                n = len(line.encode("utf-8"))
+                if size and size + n > self.max_bytes:
+                    fh.close()
+                    self._rotate()
+                    fh, size = open(self.path, "a", encoding="utf-8"), 0
+                fh.write(line)
+                size += n
+        finally:
+            fh.close()
+
+    def _rotate(self) -> None:
+        if self.backups <= 0:
+            os.remove(self.path)
+            return
+        for i in range(self.backups - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{i}"):
+                os.replace(f"{self.path}.{i}", f"{self.path}.{i + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+
+_exporter: Optional[_JsonlExporter] = None
+_exporter_lock = threading.Lock()
+
+
+def configure(path: Optional[str], max_bytes: int = MAX_BYTES, backups: int = BACKUPS) -> None:
+    """Liga a exportação JSONL em `path` (ou desliga, com `None`)."""
+    global _exporter
+    with _exporter_lock:
+        old, _exporter = _exporter, (_JsonlExporter(path, max_bytes, backups) if path else None)
+    if old is not None:
+        old.close()
+
+
+def flush() -> None:
+    """Espera a fila de exportação ser gravada (testes, fim de carga)."""
+    exporter = _exporter
+    if exporter is not None:
+        exporter.flush()
+
+
+atexit.register(configure, None)
+
+# opt‑in por ambiente, para quem não chama `configure`
+if os.environ.get("FURIACHAT_TRACE_FILE"):
+    configure(os.environ["FURIACHAT_TRACE_FILE"])
+
+
+def current_span() -> Optional[Span]:
+    return _current.get()
+
+
+def _finish(sp: Span) -> None:
+    record = sp.to_dict()
+    with _traces_lock:
+        spans = _open.setdefault(sp.trace_id, [])
+        spans.append(record)
+        if sp.parent_id is None:  # raiz fechou: trace completo
+            _finished[sp.trace_id] = _open.pop(sp.trace_id)
+            while len(_finished) > MAX_TRACES:
+                _finished.popitem(last=False)
+    exporter = _exporter
+    if exporter is not None:
+        exporter.submit(record)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    """Abre um span filho do span corrente (ou raiz de um novo trace)."""
+    sp = Span(name, _current.get(), attributes)
+    token = _current.set(sp)
+    try:
+        yield sp
+        if sp.status == "UNSET":
+            sp.status = "OK"
+    except BaseException as exc:
+        sp.status = "ERROR"
+        sp.attributes["exception"] = f"{type(exc).__name__}: {exc}"
+        raise
+    finally:
+        sp.end_ns = sp.start_ns + (time.perf_counter_ns() - sp._perf0)
+        _current.reset(token)
+        _finish(sp)
+
+
+def traced(name: Optional[str] = None, **attributes: Any) -> Callable:
+    """Decorator: envolve a função (sync ou async) num span."""
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(span_name, **attributes):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(span_name, **attributes):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def get_trace(trace_id: str) -> List[Dict]:
+    """Spans de um trace completo recente (ordenados pelo início)."""
+    trace_id = trace_id.removeprefix("0x")
+    with _traces_lock:
+        spans = list(_finished.get(trace_id, ()))
+    return sorted(spans, key=lambda s: s["start_time"])
+
+
+def waterfall_rows(spans: List[Dict]) -> List[Dict]:
+    """
+    Achata um trace para exibição em cascata: nome indentado pela
+    profundidade e início/fim em ms relativos ao primeiro span.
+    """
+    if not spans:
+        return []
+    parents = {s["context"]["span_id"]: s["parent_id"] for s in spans}
+
+    def depth(span_id: Optional[str]) -> int:
+        level = 0
+        while (span_id := parents.get(span_id)) is not None:
+            level += 1
+        return level
+
+    def ts(value: str) -> float:
+        return datetime.fromisoformat(value).timestamp() * 1000
+
+    t0 = min(ts(s["start_time"]) for s in spans)
+    rows = []
+    for s in spans:
+        start = ts(s["start_time"]) - t0
+        rows.append({
+            "span": "  " * depth(s["context"]["span_id"]) + s["name"],
+            "start_ms": round(start, 3),
+            "end_ms": round(start + s["duration_ms"], 3),
+            "duration_ms": s["duration_ms"],
+            "status": s["status"]["status_code"],
+            "attributes": json.dumps(s["attributes"], ensure_ascii=False, default=str),
+        })
+    return rows
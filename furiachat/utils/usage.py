@@ -13,14 +13,16 @@ def usage_to_dict(usage_obj: Union[dict, "UsageMetrics"]) -> Dict[str, int]:
 
     """
     Converte UsageMetrics ou dict para um dicionário padrão
-    {'prompt_tokens': int, 'completion_tokens': int, 'total_tokens': int}
+    {'prompt_tokens': int, 'completion_tokens': int, 'total_tokens': int,
+     'cached_prompt_tokens': int}
     """
     if isinstance(usage_obj, dict):
-        return usage_obj
+        return {"cached_prompt_tokens": 0, **usage_obj}
 
     # Versão nova (UsageMetrics) → tem atributos
     return {
         "prompt_tokens": getattr(usage_obj, "prompt_tokens", 0),
         "completion_tokens": getattr(usage_obj, "completion_tokens", 0),
         "total_tokens": getattr(usage_obj, "total_tokens", 0),
+        "cached_prompt_tokens": getattr(usage_obj, "cached_prompt_tokens", 0),
     }
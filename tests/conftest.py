@@ -0,0 +1,10 @@
+# tests/conftest.py
+"""Testes unitários rápidos: só põe a raiz do repositório no `sys.path`."""
+from __future__ import annotations
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
@@ -0,0 +1,61 @@
+# tests/test_batch_runner.py
+"""
+`agents.batch_runner` offline: `arun_pantera_task` falso, linhas ruins e
+falhas do ledger viram registros no JSONL sem derrubar o lote.
+"""
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import sqlite3
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from agents import batch_runner
+
+
+@pytest.fixture(autouse=True)
+def fake_agents(monkeypatch):
+    async def arun_pantera_task(question, api_key, model):
+        return {"answer": question.upper(), "usd_cost": 0.001, "total_tokens": 10}
+    monkeypatch.setitem(sys.modules, "agents.hltv_agents",
+                        SimpleNamespace(arun_pantera_task=arun_pantera_task))
+
+
+def _run(text, **kwargs):
+    out = io.StringIO()
+    stats = asyncio.run(batch_runner.run_batch(
+        batch_runner.iter_questions(io.StringIO(text)), out, "sk-x", concurrency=2, **kwargs))
+    return stats, [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_bad_lines_are_written_as_errors():
+    stats, records = _run('roster?\n{"id": "x"}\nnot {json\n{broken\n')
+    by_id = {r["id"]: r for r in records}
+    assert by_id["1"]["answer"] == "ROSTER?"
+    assert by_id["2"]["error"].startswith("linha 2: KeyError")
+    assert by_id["4"]["error"].startswith("linha 4: JSONDecodeError")
+    assert stats["answered"] == 4 and stats["errors"] == 2
+
+
+def test_ledger_failure_keeps_the_answer():
+    class LockedLedger:
+        def record(self, *args):
+            raise sqlite3.OperationalError("database is locked")
+
+    stats, records = _run("roster?\n", ledger=LockedLedger())
+    assert records[0]["answer"] == "ROSTER?" and records[0]["error"] is None
+    assert records[0]["ledger_error"] == "OperationalError: database is locked"
+    assert stats["answered"] == 1 and stats["usd_cost"] == 0.001
+
+
+def test_failed_task_still_writes_a_record(monkeypatch):
+    async def crash(item, *args):
+        raise RuntimeError("boom")
+    monkeypatch.setattr(batch_runner, "_answer_one", crash)
+    stats, records = _run("roster?\n")
+    assert records == [{"id": "1", "question": "roster?", "error": "RuntimeError: boom"}]
+    assert stats["errors"] == 1
@@ -0,0 +1,105 @@
+# tests/test_change_detection.py
+"""
+`ChangeDetector.observe`: baseline silencioso, diffs por seção publicados
+no barramento (`<página>.<seção>`) e invalidação das páginas dependentes.
+"""
+from __future__ import annotations
+
+import copy
+from datetime import datetime, timezone
+
+import pytest
+
+from furiachat.src.furiachat.tools.change_detection import ChangeDetector, fingerprint
+from furiachat.utils.events import EventBus
+
+URL = "https://www.hltv.org/team/8297/furia"
+MATCH = "https://www.hltv.org/matches/1/furia-vs-mouz"
+RESULT = "https://www.hltv.org/matches/0/furia-vs-navi"
+
+TEAM = {
+    "roster": [{"nickname": "FalleN", "country": "Brazil"},
+               {"nickname": "yuurih", "country": "Brazil"}],
+    "next_matches": [{"opponent": "MOUZ", "event": "Major",
+                      "datetime_utc": datetime(2026, 11, 1, 15, tzinfo=timezone.utc),
+                      "url": MATCH}],
+    "recent_results": [{"score": "2 - 1", "opponent": "NAVI", "event": "Major", "url": RESULT}],
+}
+
+
+@pytest.fixture
+def watched():
+    bus = EventBus()
+    events = []
+    bus.subscribe("", events.append)
+    return ChangeDetector(event_bus=bus), events
+
+
+def test_fingerprint_is_stable():
+    assert fingerprint(TEAM) == fingerprint(copy.deepcopy(TEAM))
+    assert fingerprint({"a": 1, "b": 2}) == fingerprint({"b": 2, "a": 1})
+
+
+def test_first_observation_is_baseline(watched):
+    detector, events = watched
+    assert detector.observe("team", URL, TEAM) == []
+    assert detector.observe("team", URL, copy.deepcopy(TEAM)) == []
+    assert events == []
+
+
+def test_roster_swap(watched):
+    detector, events = watched
+    detector.observe("team", URL, TEAM)
+    changed = copy.deepcopy(TEAM)
+    changed["roster"][1] = {"nickname": "KSCERATO", "country": "Brazil"}
+    detector.observe("team", URL, changed)
+
+    assert [e.topic for e in events] == ["team.roster"]
+    kinds = {(c["type"], c["nickname"]) for c in events[0].payload["changes"]}
+    assert kinds == {("player_added", "KSCERATO"), ("player_removed", "yuurih")}
+    assert events[0].payload["url"] == URL
+
+
+def test_reschedule_and_new_result(watched):
+    detector, events = watched
+    detector.observe("team", URL, TEAM)
+    changed = copy.deepcopy(TEAM)
+    changed["next_matches"][0]["datetime_utc"] = datetime(2026, 11, 2, 18, tzinfo=timezone.utc)
+    changed["recent_results"].insert(0, {"score": "0 - 2", "opponent": "Vitality",
+                                         "event": "Major", "url": MATCH})
+    detector.observe("team", URL, changed)
+
+    by_topic = {e.topic: e.payload["changes"] for e in events}
+    assert set(by_topic) == {"team.next_matches", "team.recent_results"}
+    assert by_topic["team.next_matches"][0]["type"] == "match_rescheduled"
+    assert [c["type"] for c in by_topic["team.recent_results"]] == ["result_added"]
+
+
+def test_match_score_change(watched):
+    detector, events = watched
+    match = {"teams": ["FURIA", "MOUZ"], "score": [1, 1], "veto": ["Nuke"], "mvp": None}
+    detector.observe("match", MATCH, match)
+    detector.observe("match", MATCH, {**match, "score": [2, 1], "mvp": "FalleN"})
+    assert sorted(e.topic for e in events) == ["match.mvp", "match.score"]
+
+
+def test_forget_resets_baseline(watched):
+    detector, events = watched
+    detector.observe("team", URL, TEAM)
+    detector.forget(URL)
+    detector.observe("team", URL, {**TEAM, "roster": []})
+    assert events == []
+
+
+def test_recent_result_invalidates_dependent_html(monkeypatch):
+    from furiachat.src.furiachat.tools.hltv import engine
+
+    dropped = []
+    monkeypatch.setattr(engine, "invalidate_html", dropped.append)
+    bus = EventBus()
+    bus.subscribe("team.recent_results", engine._invalidate_dependents)
+    detector = ChangeDetector(event_bus=bus)
+    detector.observe("team", URL, TEAM)
+    detector.observe("team", URL, {**TEAM, "recent_results": TEAM["recent_results"] + [
+        {"score": "2 - 0", "opponent": "G2", "event": "Major", "url": MATCH}]})
+    assert set(dropped) == {MATCH, engine.STATS_URL}
@@ -0,0 +1,56 @@
+# tests/test_ddd_index.py
+"""
+Índice local de DDD: prefixos aceitos por `PHONE_PATTERN` (+55, 0,
+0 + operadora), formatos inválidos e a versão vetorizada `resolve_many`.
+"""
+from __future__ import annotations
+
+import pytest
+
+from furiachat.src.furiachat.tools.ddd_index import (
+    DDD_INDEX,
+    extract_ddd,
+    resolve_location,
+    resolve_many,
+)
+
+
+@pytest.mark.parametrize("phone", [
+    "31988775544",          # celular sem prefixo
+    "3133445566",           # fixo
+    "+55 31 98877-5544",    # DDI
+    "5531988775544",
+    "031988775544",         # 0 + DDD
+    "01531988775544",       # 0 + operadora + DDD
+    "(31) 3344-5566",
+])
+def test_extract_ddd_prefixes(phone):
+    assert extract_ddd(phone) == "31"
+
+
+@pytest.mark.parametrize("phone", [
+    "",
+    "12345",
+    "20988775544",          # DDD inexistente
+    "319887755",            # dígito a menos
+    "319887755441",         # dígito a mais
+])
+def test_extract_ddd_rejects(phone):
+    assert extract_ddd(phone) is None
+
+
+def test_resolve_location():
+    location = resolve_location("67987654321")
+    assert location["state"] == "Mato Grosso do Sul"
+    assert "Campo Grande" in location["cities"]
+    assert location["url"].endswith("ddd-67")
+    assert resolve_location("00911112222") is None
+
+
+def test_resolve_many_matches_scalar():
+    pytest.importorskip("pandas")
+    phones = ["+55 31 98877-5544", "00911112222", "01521987654321", "6733445566"]
+    frame = resolve_many(phones)
+    ddd = [None if not isinstance(d, str) else d for d in frame["ddd"]]
+    assert ddd == [extract_ddd(p) for p in phones]
+    assert frame.loc[0, "state"] == DDD_INDEX["31"]["state"]
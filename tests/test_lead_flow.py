@@ -0,0 +1,111 @@
+# tests/test_lead_flow.py
+"""
+`LeadProfileFlow` offline: índice local de DDD primeiro, crew falso para o
+resto, dedupe de telefones repetidos e retomada pelo checkpoint.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+
+os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+pytest.importorskip("crewai")
+pytest.importorskip("pyarrow")
+pytest.importorskip("pandas")
+
+from furiachat.src.furiachat import flow as lead_flow  # noqa: E402
+
+
+class _FakeCrew:
+    agents = [SimpleNamespace(llm=SimpleNamespace(model="gpt-4o"))]
+
+    def __init__(self, calls):
+        self.calls = calls
+
+    def copy(self):
+        return self
+
+    async def kickoff_async(self, inputs):
+        self.calls.append(inputs["phone"])
+        await asyncio.sleep(0.01)
+        usage = SimpleNamespace(prompt_tokens=1000, completion_tokens=100,
+                                cached_prompt_tokens=0, total_tokens=1100,
+                                successful_requests=1)
+        return SimpleNamespace(
+            token_usage=usage,
+            to_dict=lambda: {"state": "?", "cities": [], "url": "https://x/ddd-00"})
+
+
+@pytest.fixture
+def run_flow(monkeypatch, tmp_path):
+    calls = []
+    monkeypatch.setattr(lead_flow, "Leadprofile",
+                        lambda: SimpleNamespace(crew=lambda: _FakeCrew(calls)))
+
+    def run(leads=None, **inputs):
+        result = lead_flow.LeadProfileFlow(lead_source=leads).kickoff(inputs={
+            "dataset_path": str(tmp_path / "ds"), "batch_size": 2, "concurrency": 4,
+            **inputs})
+        rows = lead_flow.ResultStore(str(tmp_path / "ds")).iter_rows()
+        return result, calls, sorted(r["phone"] for r in rows)
+    return run
+
+
+def test_repeated_phones_are_resolved_once(run_flow):
+    leads = [
+        {"name": "a", "phone": "00911112222"},   # sem DDD válido → crew
+        {"name": "b", "phone": "00911112222"},   # repetido no mesmo lote
+        {"name": "c", "phone": "31988775544"},   # índice local
+        {"name": "d", "phone": "00911112222"},   # repetido com o primeiro em voo
+        {"name": "e", "phone": "31988775544"},
+    ]
+    result, calls, phones = run_flow(leads)
+    assert calls == ["00911112222"]
+    assert phones == ["00911112222", "31988775544"]
+    assert result["processed"] == 2 and result["skipped"] == 3
+    assert result["resolved_locally"] == 1
+
+
+def test_checkpoint_skips_leads_from_previous_run(run_flow):
+    run_flow([{"name": "a", "phone": "00911112222"}])
+    result, calls, phones = run_flow([{"name": "a", "phone": "00911112222"},
+                                      {"name": "b", "phone": "00922223333"}])
+    assert calls == ["00911112222", "00922223333"]
+    assert phones == ["00911112222", "00922223333"]
+    assert result["skipped"] == 1
+
+
+def test_bad_source_lines_become_error_records(run_flow, tmp_path):
+    source = tmp_path / "leads.jsonl"
+    source.write_text('{"name": "a", "phone": "31988775544"}\n'
+                      "not json\n"
+                      '{"name": "c"}\n'
+                      '{"name": "d", "phone": "00911112222"}\n', encoding="utf-8")
+    result, calls, phones = run_flow(source=str(source))
+    assert phones == ["00911112222", "31988775544"]
+    assert result["processed"] == 2 and result["failed"] == 2
+    with open(tmp_path / "ds_errors.jsonl", encoding="utf-8") as fh:
+        errors = [json.loads(line) for line in fh]
+    assert [e["line"] for e in errors] == [2, 3]
+    assert errors[0]["error"].startswith("linha 2: JSONDecodeError")
+
+
+def test_failed_batch_write_logs_every_row(run_flow, monkeypatch, tmp_path):
+    def broken_store(self, store, table):
+        raise OSError("disco cheio")
+    monkeypatch.setattr(lead_flow.LeadProfileFlow, "store_results", broken_store)
+    leads = [{"name": "a", "phone": "00911112222"},
+             {"name": "b", "phone": "31988775544"},
+             {"name": "c", "phone": "00922223333"}]
+    result, calls, phones = run_flow(leads)
+    assert result["processed"] == 0 and result["failed"] == 3
+    assert (tmp_path / "ds.ckpt").read_text() == ""  # nada foi checkpointado
+    with open(tmp_path / "ds_errors.jsonl", encoding="utf-8") as fh:
+        errors = [json.loads(line) for line in fh]
+    assert sorted(e["phone"] for e in errors) == sorted(lead["phone"] for lead in leads)
+    assert all(e["error"] == "OSError: disco cheio" for e in errors)
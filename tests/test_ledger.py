@@ -0,0 +1,66 @@
+# tests/test_ledger.py
+"""
+`UsageLedger`: gravação a partir do dict de `run_pantera_task` e agregados
+por modelo, intenção, sessão e hora direto no SQLite.
+"""
+from __future__ import annotations
+
+import pytest
+
+from furiachat.utils.ledger import UsageLedger, question_hash
+
+
+def _answer(model: str, intent: str, cost: float, tokens: int, **extra):
+    return {"model": model, "intent": intent, "usd_cost": cost, "total_tokens": tokens,
+            "prompt_tokens": tokens - 10, "completion_tokens": 10, **extra}
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    ledger = UsageLedger(str(tmp_path / "usage.db"))
+    ledger.record("Qual o roster?", _answer("gpt-4o-mini", "roster", 0.001, 100,
+                                            snapshot_hit=True, tool_calls=0), "s1", 1.0)
+    ledger.record("Compare os mapas", _answer("gpt-4.1-mini", "stats", 0.004, 300,
+                                              tool_calls=2), "s1", 3.0)
+    ledger.record("Próximo jogo?", _answer("gpt-4o-mini", "next_match", 0.002, 200,
+                                           snapshot_hit=True), "s2", 2.0)
+    ledger.record("Próximo jogo?", {"model": "gpt-4o-mini"}, "s2", 0.5,
+                  error="PermissionError: key")
+    return ledger
+
+
+def test_question_hash_normalizes_case_and_spaces():
+    assert question_hash("Qual  o ROSTER?") == question_hash("qual o roster?")
+    assert question_hash("a") != question_hash("b")
+
+
+def test_totals(ledger):
+    totals = ledger.totals()
+    assert totals["runs"] == 4
+    assert totals["usd_cost"] == pytest.approx(0.007)
+    assert totals["total_tokens"] == 600
+    assert totals["errors"] == 1
+    assert totals["snapshot_hit_rate"] == pytest.approx(0.5)
+    assert totals["max_wall_s"] == 3.0
+
+
+def test_by_model_orders_by_cost(ledger):
+    rows = ledger.by_model()
+    assert [r["model"] for r in rows] == ["gpt-4.1-mini", "gpt-4o-mini"]
+    mini = rows[1]
+    assert mini["runs"] == 3 and mini["usd_cost"] == pytest.approx(0.003)
+    assert mini["errors"] == 1
+
+
+def test_by_session_and_intent(ledger):
+    sessions = {r["session_id"]: r for r in ledger.by_session()}
+    assert sessions["s1"]["runs"] == 2 and sessions["s1"]["avg_tool_calls"] == 1.0
+    assert sessions["s2"]["errors"] == 1
+    intents = {r["intent"]: r["runs"] for r in ledger.by_intent()}
+    assert intents == {"stats": 1, "next_match": 2, "roster": 1}  # erro classificado pela pergunta
+
+
+def test_since_and_limit(ledger):
+    assert ledger.by_hour()[0]["runs"] == 4
+    assert ledger.by_model(limit=1)[0]["model"] == "gpt-4.1-mini"
+    assert ledger.by_model(since=2 ** 40) == []
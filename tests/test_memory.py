@@ -0,0 +1,54 @@
+# tests/test_memory.py
+"""
+`ConversationMemory`: janela de turnos, resumo rolante e orçamento de
+tokens – inclusive quando o orçamento muda depois de criada (sidebar).
+"""
+from __future__ import annotations
+
+from furiachat.utils.memory import ConversationMemory, count_tokens
+
+LONG_ANSWER = "A FURIA venceu a MOUZ por 2 a 1 na Nuke. " * 10
+
+
+def _fill(memory: ConversationMemory, turns: int = 8) -> ConversationMemory:
+    for i in range(turns):
+        memory.add_turn(f"Pergunta {i} sobre a FURIA?", LONG_ANSWER)
+    return memory
+
+
+def test_window_folds_oldest_turns_into_summary():
+    memory = _fill(ConversationMemory(token_budget=4000, window_turns=3), turns=5)
+    assert len(memory) == 3
+    assert [q for q, _ in memory.turns] == [f"Pergunta {i} sobre a FURIA?" for i in (2, 3, 4)]
+    assert "Pergunta 0" in memory.summary and "Pergunta 1" in memory.summary
+
+
+def test_render_respects_budget():
+    memory = _fill(ConversationMemory(token_budget=300))
+    assert 0 < count_tokens(memory.render()) <= 300
+
+
+def test_summary_budget_follows_token_budget():
+    memory = ConversationMemory(token_budget=1000, summary_share=0.4)
+    assert memory.summary_budget == 400
+    memory.token_budget = 50
+    assert memory.summary_budget == 20
+
+
+def test_lowering_budget_shrinks_render():
+    memory = _fill(ConversationMemory(token_budget=800))
+    assert count_tokens(memory.render()) > 100
+    memory.token_budget = 100
+    assert count_tokens(memory.render()) <= 100
+
+
+def test_zero_budget_renders_nothing():
+    memory = _fill(ConversationMemory(token_budget=800))
+    memory.token_budget = 0
+    assert memory.render() == ""
+
+
+def test_clear():
+    memory = _fill(ConversationMemory())
+    memory.clear()
+    assert len(memory) == 0 and memory.render() == ""
@@ -0,0 +1,145 @@
+# tests/test_model_router.py
+"""
+Roteamento de modelo (`agents.model_router`), tabela de preços
+(`furiachat.utils.cost`) e a escada de escalonamento de `run_pantera_task`
+com o crew trocado por um falso.
+"""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from agents.model_router import (
+    COMPLEX,
+    MODEL_LADDER,
+    SIMPLE,
+    classify_complexity,
+    classify_intent,
+    escalate,
+    route_model,
+)
+from furiachat.utils.cost import get_price, model_cost
+
+
+# ───────────────────────── ROTEADOR ───────────────────────── #
+
+@pytest.mark.parametrize("question, expected", [
+    ("Quando é o próximo jogo da FURIA?", SIMPLE),
+    ("/nextmatch", SIMPLE),
+    ("Compare o desempenho da FURIA nos últimos 5 jogos", COMPLEX),
+    ("Quem é o capitão? E o coach?", COMPLEX),
+])
+def test_classify_complexity(question, expected):
+    assert classify_complexity(question) == expected
+
+
+def test_route_model_starts_on_ladder():
+    assert route_model("Qual o roster?") == MODEL_LADDER[0]
+    assert route_model("Analise a evolução da FURIA na Mirage") == MODEL_LADDER[1]
+
+
+def test_escalate_walks_ladder_and_stops():
+    assert escalate(MODEL_LADDER[0]) == MODEL_LADDER[1]
+    assert escalate(MODEL_LADDER[-1]) is None
+    assert escalate("modelo-fora-da-escada") is None
+
+
+def test_classify_intent():
+    assert classify_intent("Quando é o próximo jogo?") == "next_match"
+    assert classify_intent("Qual o placar contra a MOUZ?") == "results"
+    assert classify_intent("Bom dia") == "other"
+
+
+# ───────────────────────── PREÇOS ───────────────────────── #
+
+def test_get_price_accepts_prefix_and_version_suffix():
+    assert get_price("openai/gpt-4o") == get_price("gpt-4o")
+    # prefixo mais longo: "gpt-4o-mini-…" não pode virar "gpt-4o"
+    assert get_price("gpt-4o-mini-2024-07-18") == get_price("gpt-4o-mini")
+    with pytest.raises(KeyError):
+        get_price("claude-desconhecido")
+
+
+def test_model_cost_charges_cached_prompt_separately():
+    usage = {"prompt_tokens": 1_000_000, "completion_tokens": 1_000_000,
+             "cached_prompt_tokens": 400_000}
+    price = get_price("gpt-4o-mini")
+    expected = 600_000 / 1e6 * price.input + 400_000 / 1e6 * price.cached_input + price.output
+    assert model_cost(usage, "gpt-4o-mini") == pytest.approx(expected)
+
+
+def test_unpriced_model_costs_zero_with_a_warning(caplog):
+    usage = {"prompt_tokens": 1000, "completion_tokens": 100}
+    with caplog.at_level("WARNING", logger="furiachat.utils.cost"):
+        assert model_cost(usage, "o3-mini-sem-preco") == 0.0
+    assert "o3-mini-sem-preco" in caplog.text
+
+
+# ───────────────────────── ESCALONAMENTO ───────────────────────── #
+
+class _FakeOutput:
+    def __init__(self, text: str):
+        self.text = text
+        self.token_usage = SimpleNamespace(prompt_tokens=1000, completion_tokens=100,
+                                           cached_prompt_tokens=0, total_tokens=1100,
+                                           successful_requests=1)
+
+    def __str__(self) -> str:
+        return self.text
+
+
+class _FakeCrew:
+    def __init__(self, outcome):
+        self.outcome = outcome
+
+    def kickoff(self):
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return _FakeOutput(self.outcome)
+
+
+@pytest.fixture
+def pantera(monkeypatch):
+    """`hltv_agents` com snapshot e crew falsos; `outcomes[modelo]` decide cada tentativa."""
+    hltv_agents = pytest.importorskip("agents.hltv_agents")
+    outcomes, attempts = {}, []
+
+    def build_crew(question, key, model, context):
+        attempts.append(model)
+        outcome = outcomes[model]
+        tool = SimpleNamespace(calls=hltv_agents.MAX_ITER if outcome == "" else 0)
+        return SimpleNamespace(tools=[tool]), _FakeCrew(outcome)
+
+    monkeypatch.setattr(hltv_agents, "_build_context", lambda history: ("", False))
+    monkeypatch.setattr(hltv_agents, "_build_crew", build_crew)
+    return hltv_agents, outcomes, attempts
+
+
+def test_kickoff_errors_are_not_escalated(pantera):
+    hltv_agents, outcomes, attempts = pantera
+    outcomes[MODEL_LADDER[0]] = PermissionError("invalid api key")
+    with pytest.raises(PermissionError):
+        hltv_agents.run_pantera_task("Qual o roster?", "sk-x", model=MODEL_LADDER[0])
+    assert attempts == [MODEL_LADDER[0]]
+
+
+def test_tool_loop_failure_escalates_and_sums_cost(pantera):
+    hltv_agents, outcomes, attempts = pantera
+    outcomes[MODEL_LADDER[0]] = ""            # laço de ferramentas esgotado
+    outcomes[MODEL_LADDER[1]] = "Roster: ..."
+    answer = hltv_agents.run_pantera_task("Qual o roster?", "sk-x", model=MODEL_LADDER[0])
+    assert attempts == list(MODEL_LADDER[:2])
+    assert answer["model"] == MODEL_LADDER[1]
+    usage = {"prompt_tokens": 1000, "completion_tokens": 100, "cached_prompt_tokens": 0}
+    expected = model_cost(usage, MODEL_LADDER[0]) + model_cost(usage, MODEL_LADDER[1])
+    assert answer["usd_cost"] == pytest.approx(expected)
+    assert answer["total_tokens"] == 2200
+
+
+def test_unpriced_model_still_returns_the_answer(pantera):
+    hltv_agents, outcomes, attempts = pantera
+    outcomes["gpt-4-turbo"] = "Roster: ..."
+    answer = hltv_agents.run_pantera_task("Qual o roster?", "sk-x", model="gpt-4-turbo")
+    assert answer["answer"] == "Roster: ..."
+    assert answer["usd_cost"] == 0.0 and answer["total_tokens"] == 1100